@@ -2,7 +2,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime, timedelta
-from texts.request import TextsRequest
+from api.token import Token
+from texts.request import shared_texts_request
 from dictionary.vars import PLATFORMS
 
 
@@ -36,7 +37,6 @@ class Dashboard:
             Lista de permissões do usuário
         """
         # Verificar se é superusuário (admin)
-        from api.token import Token
         user_data = Token().get_user_permissions(token)
         is_superuser = user_data.get(
             'is_superuser', False) if user_data else False
@@ -64,7 +64,7 @@ class Dashboard:
         # Cabeçalho do dashboard
         st.header("📊 Dashboard Analytics")
 
-        texts = TextsRequest().get_texts(token)
+        texts = shared_texts_request().get_texts(token)
 
         if not texts:
             st.info("📄 Nenhum texto encontrado. Gere seu primeiro texto!")
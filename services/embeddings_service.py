@@ -1,12 +1,100 @@
+import heapq
 import requests
 import numpy as np
-from typing import List, Dict, Optional, Tuple, Any
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import FrozenSet, List, Dict, Optional, Tuple, Any
 from services.redis_service import RedisService
 from dictionary.vars import API_BASE_URL
 import logging
 
 logger = logging.getLogger(__name__)
 
+_MAX_FETCH_WORKERS = 8
+_QUERY_WORD_RE = re.compile(r'\b[a-záàâãéèêíìîóòôõúùûç]+\b')
+
+# Requisições de busca em andamento, compartilhadas entre chamadores
+_inflight_fetches: Dict[Tuple[Optional[str], Optional[str]], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+@lru_cache(maxsize=512)
+def _query_words(query_text: str) -> Tuple[str, ...]:
+    """
+    Extrai as palavras de busca de um tema, com cache em memória para
+    que regenerações do mesmo tema não refaçam o processamento.
+
+    Parameters
+    ----------
+    query_text : str
+        Texto do tema
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Palavras com 3 ou mais caracteres, sem duplicatas, em ordem
+    """
+    words = _QUERY_WORD_RE.findall(query_text.lower())
+    return tuple(dict.fromkeys(word for word in words if len(word) >= 3))
+
+
+@lru_cache(maxsize=512)
+def _topic_word_set(user_input: str) -> FrozenSet[str]:
+    """
+    Conjunto de palavras do input do usuário, com cache em memória.
+
+    Parameters
+    ----------
+    user_input : str
+        Input do usuário
+
+    Returns
+    -------
+    FrozenSet[str]
+        Palavras em minúsculas do input
+    """
+    return frozenset(user_input.lower().split())
+
+
+def _matches_filters(embedding: Dict, filters: Dict[str, Any]) -> bool:
+    """
+    Verifica se um embedding atende aos filtros de metadados. Campos de
+    texto são comparados por substring, sem diferenciar maiúsculas.
+
+    Parameters
+    ----------
+    embedding : Dict
+        Embedding retornado pela API
+    filters : Dict[str, Any]
+        Filtros de metadados
+
+    Returns
+    -------
+    bool
+        True se o embedding atende a todos os filtros
+    """
+    metadata = embedding.get("metadata") or {}
+    for key, expected in filters.items():
+        if not expected:
+            continue
+        value = embedding.get(key, metadata.get(key))
+        if isinstance(expected, dict):
+            try:
+                number = int(value)  # type: ignore
+            except (TypeError, ValueError):
+                return False
+            if "gte" in expected and number < expected["gte"]:
+                return False
+            if "lte" in expected and number > expected["lte"]:
+                return False
+        elif str(expected).lower() not in str(value or "").lower():
+            return False
+    return True
+
 
 class EmbeddingsService:
     """
@@ -92,6 +180,54 @@ class EmbeddingsService:
         """
         Busca embeddings da API com filtros opcionais.
 
+        Chamadas simultâneas com os mesmos filtros (por exemplo, sessões
+        diferentes gerando posts sobre o mesmo tema) compartilham uma única
+        requisição à API.
+
+        Parameters
+        ----------
+        origin : Optional[str]
+            Filtro por origem (webscraping, generated, business_brain)
+        search_query : Optional[str]
+            Query para busca em título e conteúdo
+
+        Returns
+        -------
+        List[Dict]
+            Lista de embeddings encontrados
+        """
+        key = (origin, search_query)
+        with _inflight_lock:
+            pending = _inflight_fetches.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                _inflight_fetches[key] = pending
+
+        if not is_owner:
+            # Cópia da lista: os chamadores reordenam o resultado
+            return list(pending.result())  # type: ignore
+
+        try:
+            embeddings = self._request_embeddings(origin, search_query)
+            pending.set_result(embeddings)  # type: ignore
+        except BaseException as e:
+            pending.set_exception(e)  # type: ignore
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight_fetches.pop(key, None)
+
+        return list(embeddings)
+
+    def _request_embeddings(
+        self,
+        origin: Optional[str] = None,
+        search_query: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Executa a requisição de busca de embeddings na API.
+
         Parameters
         ----------
         origin : Optional[str]
@@ -154,7 +290,7 @@ class EmbeddingsService:
                 # Token expirado, tentar re-autenticar
                 logger.warning("Token expired, re-authenticating...")
                 if self.authenticate():
-                    return self.fetch_embeddings(search_query=search_query)
+                    return self._request_embeddings(origin, search_query)
                 else:
                     logger.error("Re-authentication failed")
                     return []
@@ -186,58 +322,59 @@ class EmbeddingsService:
             Dicionário com cada palavra como chave e lista de embeddings
         """
         try:
-            # Dividir texto em palavras (remover pontuação e espaços)
-            import re
-            words = re.findall(
-                r'\b[a-záàâãéèêíìîóòôõúùûç]+\b', query_text.lower()
-            )
-
-            # Remover palavras muito curtas (menos de 3 caracteres)
-            words = [word for word in words if len(word) >= 3]
-
-            # Remover duplicatas mantendo ordem
-            words = list(dict.fromkeys(words))
+            # Palavras do tema (sem pontuação, curtas ou duplicadas)
+            words = list(_query_words(query_text))
 
             results_by_word = {}
 
-            for word in words:
-                # Verificar cache primeiro para esta palavra
-                cached_embeddings = None
-                if self.redis_service:
-                    try:
-                        cached_embeddings = (
-                            self.redis_service.get_cached_embeddings_by_word(
-                                word
-                            )
+            # Consultar o cache de todas as palavras em uma única ida ao Redis
+            cached_by_word: Dict[str, List[Dict]] = {}
+            if self.redis_service:
+                try:
+                    cached_by_word = (
+                        self.redis_service.get_cached_embeddings_by_words(
+                            words
                         )
-                    except Exception as e:
-                        logger.warning(
-                            f"""Error accessing Redis cache for word '{
-                                word
-                            }': {e}""")
+                    )
+                except Exception as e:
+                    logger.warning(f"Error accessing Redis word cache: {e}")
+
+            # Consultar a API em paralelo para as palavras fora do cache
+            missing_words = [
+                word for word in words if not cached_by_word.get(word)
+            ]
+            fetched_by_word: Dict[str, List[Dict]] = {}
+            if missing_words:
+                with ThreadPoolExecutor(
+                    max_workers=min(_MAX_FETCH_WORKERS, len(missing_words))
+                ) as executor:
+                    fetched_by_word = dict(zip(
+                        missing_words,
+                        executor.map(
+                            self.query_embeddings_by_text,
+                            missing_words
+                        )
+                    ))
+
+            to_cache: Dict[str, List[Dict]] = {}
+            for word in words:
+                cached_embeddings = cached_by_word.get(word)
 
                 if cached_embeddings:
                     results_by_word[word] = cached_embeddings
                     logger.info(f"Using cached embeddings for word: {word}")
                 else:
-                    # Consultar embeddings para cada palavra individual
-                    word_embeddings = self.query_embeddings_by_text(word)
+                    word_embeddings = fetched_by_word.get(word)
                     if word_embeddings:
                         results_by_word[word] = word_embeddings
+                        to_cache[word] = word_embeddings
 
-                        # Cache os resultados da palavra individual
-                        if self.redis_service:
-                            try:
-                                self.redis_service.cache_embeddings_by_word(
-                                    word,
-                                    word_embeddings
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    f"""Error caching embeddings for word '{
-                                        word
-                                    }': {e}"""
-                                )
+            # Cache dos resultados das palavras em um único pipeline
+            if to_cache and self.redis_service:
+                try:
+                    self.redis_service.cache_embeddings_by_words(to_cache)
+                except Exception as e:
+                    logger.warning(f"Error caching word embeddings: {e}")
 
             logger.info(
                 f"""Consulted {
@@ -254,7 +391,9 @@ class EmbeddingsService:
 
     def query_embeddings_by_text(
         self,
-        query_text: str
+        query_text: str,
+        size: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict]:
         """
         Consulta embeddings por texto, buscando similares em todas as origens.
@@ -263,14 +402,20 @@ class EmbeddingsService:
         ----------
         query_text : str
             Texto para busca de similares
-        top_k : int
-            Número de resultados mais similares
+        size : Optional[int]
+            Número máximo de resultados (None retorna todos)
+        filters : Optional[Dict[str, Any]]
+            Filtros de metadados (author, platform, theme, tags, origin,
+            content_type e word_count com limites ``gte``/``lte``)
 
         Returns
         -------
         List[Dict]
             Lista de embeddings similares ordenados por relevância
         """
+        if filters:
+            return self._query_embeddings_filtered(query_text, size, filters)
+
         try:
             # Verificar cache primeiro (se Redis disponível)
             cached_result = None
@@ -288,7 +433,9 @@ class EmbeddingsService:
                     logger.info(
                         f"Found {len(similar_texts)} cached embeddings"
                     )
-                    return [text_data for text_data, _ in similar_texts]
+                    return [
+                        text_data for text_data, _ in similar_texts[:size]
+                    ]
 
             # Buscar na API - buscar em todas as origens usando o query
             embeddings = self.fetch_embeddings(search_query=query_text)
@@ -296,30 +443,7 @@ class EmbeddingsService:
                 logger.warning("No embeddings found in API")
                 return []
 
-            query_lower = query_text.lower()
-            query_words = query_lower.split()
-
-            for embedding in embeddings:
-                content = embedding.get("content", "").lower()
-                title = embedding.get("title", "").lower()
-
-                # Calcular score baseado em matches de palavras-chave
-                content_matches = sum(
-                    1 for word in query_words if word in content
-                )
-                title_matches = sum(1 for word in query_words if word in title)
-
-                # Score com peso maior para matches no título
-                score = (title_matches * 2 + content_matches) / len(
-                    query_words
-                )
-                embedding["similarity_score"] = max(score, 0.1)
-
-            # Ordenar por score de similaridade
-            embeddings.sort(
-                key=lambda x: x.get("similarity_score", 0),
-                reverse=True
-            )
+            self._score_embeddings(embeddings, query_text)
 
             results = embeddings
             # Cache do resultado (se Redis disponível)
@@ -340,12 +464,140 @@ class EmbeddingsService:
                     logger.warning(f"Error caching results: {e}")
 
             logger.info(f"Found {len(results)} similar embeddings for query")
-            return results
+            return results[:size]
 
         except Exception as e:
             logger.error(f"Error querying embeddings by text: {e}")
             return []
 
+    def _query_embeddings_filtered(
+        self,
+        query_text: str,
+        size: Optional[int],
+        filters: Dict[str, Any]
+    ) -> List[Dict]:
+        """
+        Consulta embeddings aplicando os filtros de metadados antes do
+        cálculo de relevância. A origem é enviada à API; os demais filtros
+        descartam embeddings antes da pontuação.
+
+        Parameters
+        ----------
+        query_text : str
+            Texto para busca de similares (pode ser vazio)
+        size : Optional[int]
+            Número máximo de resultados (None retorna todos)
+        filters : Dict[str, Any]
+            Filtros de metadados
+
+        Returns
+        -------
+        List[Dict]
+            Lista de embeddings filtrados ordenados por relevância
+        """
+        try:
+            embeddings = self.fetch_embeddings(
+                origin=filters.get("origin") or None,
+                search_query=query_text or None
+            )
+            embeddings = [
+                embedding for embedding in embeddings
+                if _matches_filters(embedding, filters)
+            ]
+            if not embeddings:
+                logger.warning("No embeddings matched the filters")
+                return []
+
+            self._score_embeddings(embeddings, query_text)
+
+            logger.info(
+                f"Found {len(embeddings)} embeddings matching the filters"
+            )
+            return embeddings[:size]
+
+        except Exception as e:
+            logger.error(f"Error querying filtered embeddings: {e}")
+            return []
+
+    def query_by_metadata(
+        self,
+        filters: Dict[str, Any],
+        size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Busca embeddings apenas por metadados, sem consulta textual nem
+        cálculo de relevância. A origem é enviada à API e a leitura dos
+        demais filtros para ao atingir ``size`` resultados.
+
+        Parameters
+        ----------
+        filters : Dict[str, Any]
+            Filtros de metadados (author, platform, theme, tags, origin,
+            content_type e word_count com limites ``gte``/``lte``)
+        size : Optional[int]
+            Número máximo de resultados (None retorna todos)
+
+        Returns
+        -------
+        List[Dict]
+            Embeddings que atendem aos filtros, na ordem da API
+        """
+        try:
+            embeddings = self.fetch_embeddings(
+                origin=filters.get("origin") or None
+            )
+            results = list(islice(
+                (
+                    embedding for embedding in embeddings
+                    if _matches_filters(embedding, filters)
+                ),
+                size
+            ))
+
+            logger.info(f"Found {len(results)} embeddings by metadata")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error querying embeddings by metadata: {e}")
+            return []
+
+    def _score_embeddings(self, embeddings: List[Dict], query_text: str):
+        """
+        Calcula a relevância de cada embedding para a query e ordena a lista
+        pela relevância, do maior para o menor.
+
+        Parameters
+        ----------
+        embeddings : List[Dict]
+            Embeddings a pontuar (alterados no lugar)
+        query_text : str
+            Texto da busca
+        """
+        query_words = query_text.lower().split()
+
+        for embedding in embeddings:
+            if not query_words:
+                embedding["similarity_score"] = 1.0
+                continue
+
+            content = embedding.get("content", "").lower()
+            title = embedding.get("title", "").lower()
+
+            # Calcular score baseado em matches de palavras-chave
+            content_matches = sum(
+                1 for word in query_words if word in content
+            )
+            title_matches = sum(1 for word in query_words if word in title)
+
+            # Score com peso maior para matches no título
+            score = (title_matches * 2 + content_matches) / len(
+                query_words
+            )
+            embedding["similarity_score"] = max(score, 0.1)
+
+        # Ordenar por score de similaridade (todos já possuem o campo)
+        embeddings.sort(key=itemgetter("similarity_score"), reverse=True)
+
     def calculate_cosine_similarity(
         self,
         vector_a: List[float],
@@ -398,6 +650,7 @@ class EmbeddingsService:
         self,
         user_input: str,
         candidate_texts: List[Dict],
+        top_k: Optional[int] = None
     ) -> List[Tuple[Dict, float]]:
         """
         Encontra textos similares ao input do usuário.
@@ -408,8 +661,8 @@ class EmbeddingsService:
             Input do usuário
         candidate_texts : List[Dict]
             Lista de textos candidatos
-        top_k : int
-            Número de resultados mais similares
+        top_k : Optional[int]
+            Número de resultados mais similares (None retorna todos)
 
         Returns
         -------
@@ -426,26 +679,25 @@ class EmbeddingsService:
                     (
                         emb,
                         emb.get("similarity_score", 0.5)
-                    ) for emb in similar_embeddings
+                    ) for emb in similar_embeddings[:top_k]
                 ]
 
             # Calcular similaridade com textos candidatos
             similar_texts = []
-            user_input_lower = user_input.lower()
-            user_words = set(user_input_lower.split())
+            user_words = _topic_word_set(user_input)
 
             for text_data in candidate_texts:
                 content = text_data.get("content", "").lower()
                 title = text_data.get("title", "").lower()
 
                 # Calcular similaridade baseada em palavras comuns
-                content_words = set(content.split())
-                title_words = set(title.split())
-                all_text_words = content_words.union(title_words)
+                all_text_words = set(content.split())
+                all_text_words.update(title.split())
 
-                # Jaccard similarity
-                intersection = len(user_words.intersection(all_text_words))
-                union = len(user_words.union(all_text_words))
+                # Jaccard similarity (união derivada da interseção, sem
+                # materializar conjuntos intermediários)
+                intersection = len(user_words & all_text_words)
+                union = len(user_words) + len(all_text_words) - intersection
 
                 if union > 0:
                     jaccard_similarity = intersection / union
@@ -458,10 +710,16 @@ class EmbeddingsService:
                     final_score = min(1.0, jaccard_similarity + title_boost)
                     similar_texts.append((text_data, final_score))
 
-            # Ordenar por score
-            similar_texts.sort(key=lambda x: x[1], reverse=True)
-
-            results = similar_texts
+            # Ordenar por score; com top_k, seleção parcial via heap
+            if top_k is None:
+                similar_texts.sort(key=itemgetter(1), reverse=True)
+                results = similar_texts
+            else:
+                results = heapq.nlargest(
+                    top_k,
+                    similar_texts,
+                    key=itemgetter(1)
+                )
             logger.info(f"Found {len(results)} similar texts from candidates")
             return results
 
@@ -3,12 +3,36 @@ import json
 import hashlib
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _make_cache_key(prefix: str, text: str) -> str:
+    """
+    Monta uma chave de cache a partir do hash do texto, com cache em
+    memória para que palavras e temas repetidos não sejam hasheados de
+    novo.
+
+    Parameters
+    ----------
+    prefix : str
+        Prefixo da chave (tipo de dado armazenado)
+    text : str
+        Texto consultado
+
+    Returns
+    -------
+    str
+        Chave Redis no formato ``prefixo:hash``
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16)
+    return f"{prefix}:{digest.hexdigest()}"
+
+
 class RedisService:
     """
     Serviço para interação com Redis.
@@ -80,9 +104,7 @@ class RedisService:
             if not self.client:
                 return
 
-            cache_key = f"""word_embeddings:{
-                hashlib.md5(word.encode()).hexdigest()
-            }"""
+            cache_key = self._word_cache_key(word)
 
             cache_data = {
                 "word": word,
@@ -94,7 +116,7 @@ class RedisService:
             self.client.setex(
                 cache_key,
                 expiration,
-                json.dumps(cache_data, ensure_ascii=False)
+                self._dumps(cache_data)
             )
             logger.info(f"""Word embeddings cached: {
                 word
@@ -102,6 +124,46 @@ class RedisService:
         except Exception as e:
             logger.error(f"Error caching word embeddings: {e}")
 
+    def cache_embeddings_by_words(self,
+                                  embeddings_by_word: Dict[str, List[Dict]],
+                                  expiration: int = 86400):
+        """
+        Armazena embeddings de várias palavras no cache Redis usando um
+        único pipeline (uma ida ao servidor).
+
+        Parameters
+        ----------
+        embeddings_by_word : Dict[str, List[Dict]]
+            Embeddings por palavra consultada
+        expiration : int
+            Tempo de expiração em segundos
+        """
+        try:
+            if not self.client or not embeddings_by_word:
+                return
+
+            cached_at = datetime.now().isoformat()
+            pipe = self.client.pipeline(transaction=False)
+            for word, embeddings_data in embeddings_by_word.items():
+                cache_data = {
+                    "word": word,
+                    "embeddings": embeddings_data,
+                    "cached_at": cached_at,
+                    "total_found": len(embeddings_data)
+                }
+                pipe.setex(
+                    self._word_cache_key(word),
+                    expiration,
+                    self._dumps(cache_data)
+                )
+            pipe.execute()
+
+            logger.info(
+                f"Word embeddings cached for {len(embeddings_by_word)} words"
+            )
+        except Exception as e:
+            logger.error(f"Error caching word embeddings: {e}")
+
     def get_cached_embeddings_by_word(self, word: str) -> Optional[List[Dict]]:
         """
         Recupera embeddings em cache para uma palavra específica.
@@ -120,9 +182,7 @@ class RedisService:
             if not self.client:
                 return None
 
-            cache_key = f"""word_embeddings:{
-                hashlib.md5(word.encode()).hexdigest()
-            }"""
+            cache_key = self._word_cache_key(word)
             cached_data = self.client.get(cache_key)
 
             if cached_data:
@@ -140,6 +200,85 @@ class RedisService:
             logger.error(f"Error retrieving cached word embeddings: {e}")
             return None
 
+    def get_cached_embeddings_by_words(
+            self,
+            words: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Recupera em uma única consulta (MGET) os embeddings em cache de
+        várias palavras.
+
+        Parameters
+        ----------
+        words : List[str]
+            Palavras para buscar no cache
+
+        Returns
+        -------
+        Dict[str, List[Dict]]
+            Embeddings por palavra, apenas para as palavras encontradas
+        """
+        try:
+            if not self.client or not words:
+                return {}
+
+            cached_values = self.client.mget(
+                [self._word_cache_key(word) for word in words]
+            )
+
+            results = {}
+            for word, cached_data in zip(
+                words,
+                cached_values  # type: ignore
+            ):
+                if cached_data:
+                    embeddings = json.loads(cached_data).get("embeddings", [])
+                    if embeddings:
+                        results[word] = embeddings
+
+            logger.info(
+                f"""Retrieved cached embeddings for {
+                    len(results)
+                } of {len(words)} words"""
+            )
+            return results
+        except Exception as e:
+            logger.error(f"Error retrieving cached word embeddings: {e}")
+            return {}
+
+    def _dumps(self, data) -> str:
+        """
+        Serializa dados para o cache em JSON compacto (sem espaços e sem
+        escapes de caracteres não ASCII).
+
+        Parameters
+        ----------
+        data : Any
+            Dados serializáveis em JSON
+
+        Returns
+        -------
+        str
+            JSON compacto
+        """
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+    def _word_cache_key(self, word: str) -> str:
+        """
+        Monta a chave de cache dos embeddings de uma palavra.
+
+        Parameters
+        ----------
+        word : str
+            Palavra consultada
+
+        Returns
+        -------
+        str
+            Chave Redis da palavra
+        """
+        return _make_cache_key("word_embeddings", word)
+
     def cache_embeddings(self,
                          query: str,
                          embeddings_data: Dict,
@@ -161,7 +300,7 @@ class RedisService:
                 logger.error("Redis client not initialized")
                 return
 
-            cache_key = f"embeddings:{hashlib.md5(query.encode()).hexdigest()}"
+            cache_key = _make_cache_key("embeddings", query)
             cache_data = {
                 'query': query,
                 'embeddings_data': embeddings_data,
@@ -171,7 +310,7 @@ class RedisService:
             self.client.setex(
                 cache_key,
                 expiration,
-                json.dumps(cache_data)
+                self._dumps(cache_data)
             )
 
             logger.info(f"Cached embeddings for query: {query}")
@@ -197,7 +336,7 @@ class RedisService:
             if not self.client:
                 return None
 
-            cache_key = f"embeddings:{hashlib.md5(query.encode()).hexdigest()}"
+            cache_key = _make_cache_key("embeddings", query)
             cached_data = self.client.get(cache_key)
 
             if cached_data:
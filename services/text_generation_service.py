@@ -1,6 +1,7 @@
 import requests
 import openai
 import os
+import re
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from dictionary.vars import API_BASE_URL, PLATFORMS
@@ -12,6 +13,14 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Padrões de tamanho do texto e de limpeza, compilados uma única vez
+_EXACT_LENGTH_RE = re.compile(r'Exato \((\d+) palavras\)')
+_NUMBER_RE = re.compile(r'\d+')
+_EXACT_TARGET_RE = re.compile(r'EXATAMENTE\s+(\d+)\s+palavras')
+_TARGET_RE = re.compile(r'(\d+)\s+palavras')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+_EXTRA_SPACES_RE = re.compile(r' {2,}')
+
 
 class TextGenerationService:
     """
@@ -26,6 +35,11 @@ class TextGenerationService:
         # Inicializar serviço de embeddings via API
         self.embeddings_service = EmbeddingsService()
 
+        # Esqueletos de prompt por (plataforma, tom, criatividade, tamanho)
+        self._prompt_skeletons: Dict[
+            Tuple[str, str, str, str], Tuple[str, str]
+        ] = {}
+
         # Configuração OpenAI
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.default_model = os.getenv('DEFAULT_MODEL', 'gpt-4o-mini')
@@ -150,7 +164,7 @@ class TextGenerationService:
         """
         try:
             similar_texts = self.embeddings_service.find_similar_texts(
-                user_input, candidate_texts
+                user_input, candidate_texts, top_k=top_k
             )
             logger.info(f"Found {len(similar_texts)} similar texts via API")
             return similar_texts
@@ -235,40 +249,19 @@ class TextGenerationService:
         str
             Contexto completo para o prompt
         """
-        # Extrair o número específico de palavras do parâmetro length
-        word_count = self.extract_word_count(length)
+        # Partes fixas do prompt, montadas uma vez por combinação
+        style_block, final_tail = self._get_prompt_skeleton(
+            platform,
+            tone,
+            creativity_level,
+            length
+        )
 
         context_parts = [
-            f"TEMA: {user_topic}\n\n"
+            f"TEMA: {user_topic}\n\n",
+            style_block
         ]
 
-        # Instruções OBRIGATÓRIAS sobre tamanho (sempre no início)
-        context_parts.append(
-            f"INSTRUÇÃO OBRIGATÓRIA DE TAMANHO:\n"
-            f"Você DEVE escrever EXATAMENTE {word_count} palavras. "
-            f"Não mais, não menos. Este é um requisito RIGOROSO.\n"
-            f"Conte as palavras conforme escreve e ajuste para atingir "
-            f"precisamente {word_count} palavras.\n\n"
-        )
-
-        # Parâmetros de estilo
-        context_parts.append(
-            f"PARÂMETROS DE ESTILO:\n"
-            f"• Tom: {tone}\n"
-            f"• Criatividade: {creativity_level}\n"
-        )
-
-        # Contexto da plataforma (reescrito para ser mais direto)
-        if platform and platform in PLATFORMS:
-            platform_name = PLATFORMS[platform]
-            platform_context = self.get_platform_context_optimized(platform)
-            context_parts.append(
-                f"• Plataforma: {platform_name}\n"
-                f"• Adaptação: {platform_context}\n"
-            )
-
-        context_parts.append("\n")
-
         # Referências dos múltiplos índices (limitadas para não sobrecarregar)
         if similar_texts:
             context_parts.append("REFERÊNCIAS ENCONTRADAS:\n")
@@ -301,25 +294,92 @@ class TextGenerationService:
             )
 
         # Instruções finais REFORÇADAS
-        context_parts.append(
-            f"\nINSTRUÇÃO FINAL:\n"
-            f"Crie um texto sobre '{user_topic}' com EXATAMENTE {word_count} "
+        context_parts.append("\nINSTRUÇÃO FINAL:\nCrie um texto sobre '")
+        context_parts.append(user_topic)
+        context_parts.append(final_tail)
+
+        return "".join(context_parts)
+
+    def _get_prompt_skeleton(
+            self,
+            platform: str,
+            tone: str,
+            creativity_level: str,
+            length: str
+    ) -> Tuple[str, str]:
+        """
+        Obtém as partes fixas do prompt para a combinação de parâmetros,
+        montando-as apenas na primeira vez.
+
+        Parameters
+        ----------
+        platform : str
+            Plataforma de destino (opcional)
+        tone : str
+            Tom da linguagem
+        creativity_level : str
+            Nível de criatividade
+        length : str
+            Tamanho desejado do texto
+
+        Returns
+        -------
+        Tuple[str, str]
+            Bloco de tamanho/estilo/plataforma e o final da instrução
+            que segue o tema
+        """
+        key = (platform, tone, creativity_level, length)
+        skeleton = self._prompt_skeletons.get(key)
+        if skeleton is not None:
+            return skeleton
+
+        # Extrair o número específico de palavras do parâmetro length
+        word_count = self.extract_word_count(length)
+
+        # Instruções OBRIGATÓRIAS sobre tamanho (sempre no início)
+        style_parts = [
+            f"INSTRUÇÃO OBRIGATÓRIA DE TAMANHO:\n"
+            f"Você DEVE escrever EXATAMENTE {word_count} palavras. "
+            f"Não mais, não menos. Este é um requisito RIGOROSO.\n"
+            f"Conte as palavras conforme escreve e ajuste para atingir "
+            f"precisamente {word_count} palavras.\n\n",
+            # Parâmetros de estilo
+            f"PARÂMETROS DE ESTILO:\n"
+            f"• Tom: {tone}\n"
+            f"• Criatividade: {creativity_level}\n"
+        ]
+
+        # Contexto da plataforma (reescrito para ser mais direto)
+        if platform and platform in PLATFORMS:
+            platform_name = PLATFORMS[platform]
+            platform_context = self.get_platform_context_optimized(platform)
+            style_parts.append(
+                f"• Plataforma: {platform_name}\n"
+                f"• Adaptação: {platform_context}\n"
+            )
+
+        style_parts.append("\n")
+
+        final_parts = [
+            f"' com EXATAMENTE {word_count} "
             f"palavras. Use tom {tone} e nível {creativity_level}. "
             f"CRÍTICO: O texto deve ter precisamente {word_count} palavras. "
             f"Verifique a contagem antes de finalizar."
-        )
+        ]
 
         if platform:
             platform_name = PLATFORMS.get(platform, platform)
-            context_parts.append(
+            final_parts.append(
                 f" Otimize para {platform_name}."
             )
 
-        context_parts.append(
+        final_parts.append(
             f"\n\nLEMBRETE: {word_count} palavras é OBRIGATÓRIO!"
         )
 
-        return "".join(context_parts)
+        skeleton = ("".join(style_parts), "".join(final_parts))
+        self._prompt_skeletons[key] = skeleton
+        return skeleton
 
     def extract_word_count(self, length: str) -> int:
         """
@@ -336,11 +396,9 @@ class TextGenerationService:
         int
             Número de palavras alvo
         """
-        import re
-
         # Primeiro, tentar extrair de formato "Exato (X palavras)"
         if "Exato" in length:
-            match = re.search(r'Exato \((\d+) palavras\)', length)
+            match = _EXACT_LENGTH_RE.search(length)
             if match:
                 return int(match.group(1))
 
@@ -356,7 +414,7 @@ class TextGenerationService:
             return length_mapping[length]
 
         # Tentar extrair número da string usando regex
-        numbers = re.findall(r'\d+', length)
+        numbers = _NUMBER_RE.findall(length)
         if numbers:
             # Se há range (ex: 100-200), usar o meio termo
             if len(numbers) >= 2:
@@ -454,15 +512,13 @@ class TextGenerationService:
         int
             Número alvo de palavras
         """
-        import re
-
         # Procurar por "EXATAMENTE X palavras" no contexto
-        match = re.search(r'EXATAMENTE\s+(\d+)\s+palavras', context)
+        match = _EXACT_TARGET_RE.search(context)
         if match:
             return int(match.group(1))
 
         # Fallback: procurar qualquer número seguido de "palavras"
-        match = re.search(r'(\d+)\s+palavras', context)
+        match = _TARGET_RE.search(context)
         if match:
             return int(match.group(1))
 
@@ -490,11 +546,10 @@ class TextGenerationService:
         cleaned_text = text.replace('*', '')
 
         # Remove múltiplas quebras de linha consecutivas
-        import re
-        cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
+        cleaned_text = _EXTRA_NEWLINES_RE.sub('\n\n', cleaned_text)
 
         # Remove espaços extras
-        cleaned_text = re.sub(r' {2,}', ' ', cleaned_text)
+        cleaned_text = _EXTRA_SPACES_RE.sub(' ', cleaned_text)
 
         return cleaned_text.strip()
 
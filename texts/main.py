@@ -1,6 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 import streamlit as st
 import pandas as pd
-from texts.request import TextsRequest
+from texts.request import shared_texts_request
 from dictionary.vars import PLATFORMS
 from services.embeddings_service import EmbeddingsService
 from services.redis_service import RedisService
@@ -9,6 +12,254 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_NO_CONTENT = 'Post não disponível'
+_COUNTER_TMPL = "**📊 Caracteres:** {}/500"
+
+# Blocos de markdown estáticos, montados uma única vez na importação
+_GENERATION_SUMMARY_TMPL = """
+📱 **Plataforma:** {platform}
+📝 **Tom:** {tone}
+🎨 **Criatividade:** {creativity}
+📏 **Tamanho:** {length}
+📚 **Referências:** {references}
+📊 **Palavras:** {word_count} (alvo: {target_count})
+"""
+
+_WAITING_GENERATION_MD = """
+🤖 **Aguardando Geração**
+
+Configure os parâmetros e clique em **"🚀 Gerar Post"**.
+"""
+
+_EMPTY_LIBRARY_MD = """
+**📄 Biblioteca Vazia**
+
+Nenhum post foi encontrado. Que tal criar seu primeiro post?
+
+👉 Vá para **"🚀 Gerar Novo Post"** no menu acima.
+"""
+
+_NO_POSTS_TO_EDIT_MD = """
+**📄 Nenhum post encontrado**
+
+Não há posts para edição.
+"""
+
+_CREATE_DENIED_MD = """
+**🔒 Acesso Restrito**
+
+Sem permissão para gerar posts.
+"""
+
+_READ_DENIED_MD = """
+**🔒 Acesso Restrito**
+
+Você não possui permissão para visualizar posts.
+Entre em contato com o administrador para solicitar acesso.
+"""
+
+_UPDATE_DENIED_MD = """
+**🔒 Acesso Restrito**
+
+Sem permissão para atualizar posts.
+"""
+
+# Emoji e rótulo do status do post, indexados por is_approved
+_CARD_STATUS = (
+    ('⏳', 'Pendente'),
+    ('✅', 'Aprovado'),
+)
+
+READ = 1
+CREATE = 2
+UPDATE = 4
+DELETE = 8
+
+_PERMISSION_BITS = {
+    'read': READ,
+    'create': CREATE,
+    'update': UPDATE,
+    'delete': DELETE,
+}
+
+
+class MenuAction(IntEnum):
+    """
+    Identificadores das ações do menu de textos.
+    """
+    LIBRARY = 0
+    CREATE = 1
+
+
+_ACTION_LABELS = {
+    MenuAction.LIBRARY: "📚 Biblioteca de Posts",
+    MenuAction.CREATE: "🚀 Gerar Novo Post",
+}
+
+_ACTION_PERMISSIONS = {
+    MenuAction.LIBRARY: READ,
+    MenuAction.CREATE: CREATE,
+}
+
+
+@st.cache_resource
+def _embeddings_service() -> EmbeddingsService:
+    """
+    Retorna o serviço de embeddings compartilhado entre reruns e sessões.
+
+    Returns
+    -------
+    EmbeddingsService
+        Instância única do serviço de embeddings.
+    """
+    return EmbeddingsService()
+
+
+@st.cache_resource
+def _redis_service() -> RedisService:
+    """
+    Retorna o serviço Redis compartilhado entre reruns e sessões.
+
+    Returns
+    -------
+    RedisService
+        Instância única do serviço Redis.
+    """
+    return RedisService()
+
+
+@st.cache_resource
+def _text_generation_service() -> TextGenerationService:
+    """
+    Retorna o serviço de geração de texto compartilhado entre reruns e
+    sessões, evitando recriar os clientes OpenAI e Redis a cada interação.
+
+    Returns
+    -------
+    TextGenerationService
+        Instância única do serviço de geração de texto.
+    """
+    return TextGenerationService()
+
+
+@st.cache_resource
+def _background_executor() -> ThreadPoolExecutor:
+    """
+    Retorna o executor compartilhado para requisições em segundo plano.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        Executor reutilizado entre reruns e sessões.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get_texts(token):
+    """
+    Consulta a lista de posts, reaproveitando o resultado entre reruns.
+
+    O cache é invalidado (``_clear_texts_cache()``) após cada
+    criação, aprovação, reprovação ou atualização de post.
+
+    Parameters
+    ----------
+    token : str
+        Token utilizado na requisição de consulta.
+
+    Returns
+    -------
+    list
+        Os posts registrados, com tema e conteúdo em minúsculas para a
+        busca (``_theme_lc`` e ``_content_lc``), ou None em caso de erro.
+    """
+    texts = shared_texts_request().get_texts(token)
+
+    if texts is None:
+        return None
+
+    # Minúsculas calculadas uma vez por consulta, não a cada tecla da
+    # busca; cópias evitam alterar os registros do cache de ETags
+    return [
+        {
+            **text,
+            '_theme_lc': (text.get('theme') or '').lower(),
+            '_content_lc': _text_content(text).lower(),
+        }
+        for text in texts
+    ]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_text(token, text_id):
+    """
+    Consulta um post pelo identificador, reaproveitando o resultado entre
+    reruns (por exemplo, a cada tecla digitada no formulário de edição).
+
+    Parameters
+    ----------
+    token : str
+        Token utilizado na requisição de consulta.
+    text_id : int
+        Número identificador do post.
+
+    Returns
+    -------
+    dict
+        Os dados do post, ou None em caso de erro.
+    """
+    return shared_texts_request().get_text(token, text_id)
+
+
+def _text_content(text):
+    """
+    Retorna o conteúdo do post, com ``generated_text`` como alternativa.
+
+    Parameters
+    ----------
+    text : dict
+        Os dados do post.
+
+    Returns
+    -------
+    str
+        O conteúdo do post, ou texto vazio se ausente.
+    """
+    return text.get('content') or text.get('generated_text') or ''
+
+
+def _clear_texts_cache():
+    """
+    Invalida os caches de consulta de posts após uma escrita na API.
+    """
+    _cached_get_texts.clear()
+    _cached_get_text.clear()
+
+
+@st.cache_data
+def _permission_bits(user_permissions) -> int:
+    """
+    Converte as permissões do usuário em uma máscara de bits.
+
+    Parameters
+    ----------
+    user_permissions : list
+        Lista das permissões do usuário.
+
+    Returns
+    -------
+    int
+        Máscara com os bits READ, CREATE, UPDATE e DELETE.
+    """
+    raw = shared_texts_request().get_text_permissions(
+        user_permissions=user_permissions
+    )
+    bits = 0
+    for permission in raw:
+        bits |= _PERMISSION_BITS[permission]
+    return bits
+
 
 class Texts:
     """
@@ -22,9 +273,9 @@ class Texts:
     """
 
     def __init__(self):
-        self.embeddings_service = EmbeddingsService()
-        self.redis_service = RedisService()
-        self.text_service = TextGenerationService()
+        self.embeddings_service = _embeddings_service()
+        self.redis_service = _redis_service()
+        self.text_service = _text_generation_service()
 
     def treat_texts_dataframe(self, texts_data):
         """
@@ -41,38 +292,35 @@ class Texts:
             A série de dados tratados.
         """
 
-        df = pd.DataFrame(texts_data)
-        df = df.drop(columns=['id'])
-
-        # Mapear campos da API para campos esperados pelo frontend
-        if 'content' in df.columns and 'generated_text' not in df.columns:
-            df['generated_text'] = df['content']
-
-        # Mapear status baseado no campo is_approved da API
-        if 'is_approved' in df.columns and 'status' not in df.columns:
-            df['status'] = df['is_approved'].apply(
-                lambda x: 'approved' if x else 'pending_approval')
+        # Montar diretamente as colunas finais, em uma única alocação
+        rows = [
+            (
+                text.get('theme'),
+                text.get('generated_text', text.get('content')),
+                text.get('created_at'),
+                text.get('status') or (
+                    'approved' if text.get('is_approved')
+                    else 'pending_approval'
+                ),
+            )
+            for text in texts_data
+        ]
 
-        df = df.rename(
-            columns={
-                'theme': 'Tema',
-                'generated_text': 'Post Gerado',
-                'created_at': 'Data de Criação',
-                'status': 'Status',
-            }
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "Tema",
+                "Post Gerado",
+                "Data de Criação",
+                "Status",
+            ]
         )
 
-        df = df[[
-            "Tema",
-            "Post Gerado",
-            "Data de Criação",
-            "Status",
-        ]
-        ]
-
-        df = df.sort_values(
+        df.sort_values(
             by="Data de Criação",
-            ascending=False
+            ascending=False,
+            inplace=True,
+            kind="stable"
         )
 
         return df
@@ -91,14 +339,7 @@ class Texts:
         texts_index : dict
             Dicionário com os índices.
         """
-        texts_topics = []
-        texts_ids = []
-
-        for text in texts:
-            texts_topics.append(text['theme'])
-            texts_ids.append(text['id'])
-
-        texts_index = dict(zip(texts_topics, texts_ids))
+        texts_index = {text['theme']: text['id'] for text in texts}
 
         return texts_index
 
@@ -118,13 +359,12 @@ class Texts:
         str
             O tema validado.
         """
-        if not topic or len(topic.strip()) < 5:
-            return False, topic
+        stripped_topic = topic.strip() if topic else ''
 
-        if len(topic.strip()) > 500:
+        if not 5 <= len(stripped_topic) <= 500:
             return False, topic
 
-        return True, topic.strip()
+        return True, stripped_topic
 
     def _process_text_generation_improved(
             self,
@@ -217,10 +457,14 @@ class Texts:
                             )
                         )
 
-                        # 5. Cache no Redis
+                        # 5. Cache no Redis (em segundo plano, em paralelo
+                        # com a geração do post)
                         if similar_texts:
-                            self.redis_service.cache_embeddings(
-                                search_query, {'similar_texts': similar_texts})
+                            _background_executor().submit(
+                                self.redis_service.cache_embeddings,
+                                search_query,
+                                {'similar_texts': similar_texts}
+                            )
 
                             # Simples confirmação de referências encontradas
                             count = len(similar_texts)
@@ -277,31 +521,18 @@ class Texts:
                 "is_approved": False
             }
 
-            # Registrar na API do projeto unipost-api
-            try:
-                send_result = TextsRequest().create_text(
+            # Registrar na API do projeto unipost-api em segundo plano,
+            # enquanto o resultado é exibido
+            send_future = _background_executor().submit(
+                asyncio.run,
+                shared_texts_request().create_text_async(
                     token=token,
                     text_data=text_data
                 )
-                logger.info(
-                    f"Text successfully registered in API: {send_result}")
-
-                # Armazenar o ID do texto para usar nos botões de aprovação
-                created_text_id = send_result.get("text_id")
-
-            except Exception as api_error:
-                logger.error(f"Error registering in API: {api_error}")
-                send_result = {
-                    "success": False,
-                    "message": f"""❌ **Erro ao registrar na API**: {
-                        str(api_error)
-                    }""",
-                    "text_id": None
-                }
-                created_text_id = None
+            )
 
             progress_bar.progress(100)
-            status_text.text("✅ Post salvo")
+            status_text.text("✅ Post gerado")
 
             # Processamento concluído
 
@@ -318,20 +549,19 @@ class Texts:
                                  if platform else 'Genérico')
 
                 # Contar palavras do post gerado
-                word_count = len(
-                    generated_text.split()
-                ) if generated_text else 0
+                word_count = self.text_service.count_words(generated_text)
                 target_count = self.text_service.extract_word_count(length)
 
                 # Mostrar informações em formato nativo
-                st.info(f"""
-                📱 **Plataforma:** {platform_name}
-                📝 **Tom:** {tone.title()}
-                🎨 **Criatividade:** {creativity_level.title()}
-                📏 **Tamanho:** {length}
-                📚 **Referências:** {len(similar_texts)}
-                📊 **Palavras:** {word_count} (alvo: {target_count})
-                """)
+                st.info(_GENERATION_SUMMARY_TMPL.format(
+                    platform=platform_name,
+                    tone=tone.title(),
+                    creativity=creativity_level.title(),
+                    length=length,
+                    references=len(similar_texts),
+                    word_count=word_count,
+                    target_count=target_count
+                ))
 
                 # Post gerado principal
                 with st.container():
@@ -341,68 +571,16 @@ class Texts:
                 # Seção de ações
                 st.subheader("🎛️ Ações Disponíveis")
 
-                col_approve, col_reject, col_regenerate = st.columns(3)
+                col_review, col_regenerate = st.columns([2, 1])
 
-                # Botão Aprovar - Gerar embedding quando aprovado
-                with col_approve:
-                    if st.button(
-                        "✅ Aprovar Post",
-                        key="approve_generated",
-                        use_container_width=True,
-                        type="primary",
-                        help="Aprovar post"
-                    ):
-                        # Aprovar post e gerar embedding
-                        if created_text_id:
-                            with st.spinner(
-                                "Aprovando post..."
-                            ):
-                                approval_result = TextsRequest().approve_and_generate_embedding(  # noqa: E501
-                                    token,
-                                    created_text_id,
-                                    generated_text,
-                                    user_topic
-                                )
-                            st.toast(approval_result, icon="✅")
-
-                            if 'last_generated' in st.session_state:
-                                st.session_state[
-                                    'last_generated'
-                                ]['approved'] = True
-                            st.rerun()
-                        else:
-                            st.toast(
-                                "Erro: ID do texto não encontrado",
-                                icon="❌"
-                            )
-
-                # Botão Reprovar
-                with col_reject:
-                    if st.button(
-                        "❌ Reprovar",
-                        key="reject_generated",
-                        use_container_width=True,
-                        type="secondary",
-                        help="Reprovar post"
-                    ):
-                        # Reprovar post
-                        if created_text_id:
-                            with st.spinner("Reprovando post..."):
-                                rejection_result = TextsRequest().reject_text(
-                                    token, created_text_id
-                                )
-                            st.toast(rejection_result, icon="❌")
-
-                            if 'last_generated' in st.session_state:
-                                st.session_state[
-                                    'last_generated'
-                                ]['approved'] = False
-                            st.rerun()
-                        else:
-                            st.toast(
-                                "Erro: ID do texto não encontrado",
-                                icon="❌"
-                            )
+                # Aprovar/Reprovar reexecutam apenas o próprio fragmento
+                with col_review:
+                    self._render_review_actions(
+                        token,
+                        send_future,
+                        generated_text,
+                        user_topic
+                    )
 
                 # Botão Regenerar (sempre ativo)
                 with col_regenerate:
@@ -429,10 +607,10 @@ class Texts:
                         st.rerun()
 
                 # Mostrar resultado do registro na API
+                send_result = self._wait_send_result(send_future)
                 if send_result.get("success"):
-                    import time
+                    _clear_texts_cache()
                     st.toast("✅ Texto gerado com sucesso", icon="✅")
-                    time.sleep(2.5)
                 else:
                     st.error(
                         f"""🚨 Erro no registro: {
@@ -464,6 +642,117 @@ class Texts:
             except Exception:
                 pass  # Elementos podem já ter sido removidos
 
+    @st.fragment
+    def _render_review_actions(
+            self,
+            token,
+            send_future,
+            generated_text,
+            user_topic):
+        """
+        Botões de aprovação e reprovação do post recém-gerado.
+
+        Executado como fragmento: um clique atualiza o estado da sessão
+        sem reexecutar a página inteira.
+
+        Parameters
+        ----------
+        token : str
+            O token utilizado no envio da requisição.
+        send_future : Future
+            Future do registro do post na API.
+        generated_text : str
+            O post gerado.
+        user_topic : str
+            O tema informado pelo usuário.
+        """
+        col_approve, col_reject = st.columns(2)
+
+        # Botão Aprovar - Gerar embedding quando aprovado
+        with col_approve:
+            if st.button(
+                "✅ Aprovar Post",
+                key="approve_generated",
+                use_container_width=True,
+                type="primary",
+                help="Aprovar post"
+            ):
+                # Aprovar post e gerar embedding
+                created_text_id = self._wait_send_result(
+                    send_future
+                ).get("text_id")
+                if created_text_id:
+                    with st.spinner("Aprovando post..."):
+                        approval_result = (
+                            shared_texts_request().approve_and_generate_embedding(
+                                token,
+                                created_text_id,
+                                generated_text,
+                                user_topic
+                            )
+                        )
+                    _clear_texts_cache()
+                    st.toast(approval_result["message"], icon="✅")
+
+                    if 'last_generated' in st.session_state:
+                        st.session_state['last_generated']['approved'] = True
+                else:
+                    st.toast("Erro: ID do texto não encontrado", icon="❌")
+
+        # Botão Reprovar
+        with col_reject:
+            if st.button(
+                "❌ Reprovar",
+                key="reject_generated",
+                use_container_width=True,
+                type="secondary",
+                help="Reprovar post"
+            ):
+                # Reprovar post
+                created_text_id = self._wait_send_result(
+                    send_future
+                ).get("text_id")
+                if created_text_id:
+                    with st.spinner("Reprovando post..."):
+                        rejection_result = shared_texts_request().reject_text(
+                            token, created_text_id
+                        )
+                    _clear_texts_cache()
+                    st.toast(rejection_result, icon="❌")
+
+                    if 'last_generated' in st.session_state:
+                        st.session_state['last_generated']['approved'] = False
+                else:
+                    st.toast("Erro: ID do texto não encontrado", icon="❌")
+
+    def _wait_send_result(self, send_future):
+        """
+        Aguarda o registro do post na API iniciado em segundo plano.
+
+        Parameters
+        ----------
+        send_future : Future
+            Future retornado pelo envio de create_text_async.
+
+        Returns
+        -------
+        dict
+            Resultado do registro, com success, message e text_id.
+        """
+        try:
+            send_result = send_future.result()
+            logger.info(f"Text successfully registered in API: {send_result}")
+        except Exception as api_error:
+            logger.error(f"Error registering in API: {api_error}")
+            send_result = {
+                "success": False,
+                "message": f"""❌ **Erro ao registrar na API**: {
+                    str(api_error)
+                }""",
+                "text_id": None
+            }
+        return send_result
+
     def create(self, token, menu_position, permissions):
         # menu_position não utilizado nesta função
         _ = menu_position
@@ -476,15 +765,15 @@ class Texts:
             O token obtido e passado para a validação da requisição.
         menu_position : Any
             A posição do menu superior.
-        permissions : list
-            A lista de permissões do usuário.
+        permissions : int
+            Máscara de bits com as permissões do usuário.
         """
         # Limpar dados de post anterior ao acessar a tela
         if 'last_generated' in st.session_state:
             del st.session_state['last_generated']
 
         # Exibir status dos serviços no menu
-        if 'create' in permissions:
+        if permissions & CREATE:
 
             # Layout principal: Parâmetros | Resultado
             # Novos campos obrigatórios
@@ -624,37 +913,27 @@ class Texts:
                 # Estado inicial limpo
                 if not generate_button:
                     with result_container:
-                        st.info("""
-                        🤖 **Aguardando Geração**
-
-                        Configure os parâmetros e clique em **"🚀 Gerar Post"**.
-                        """)
+                        st.info(_WAITING_GENERATION_MD)
 
             # Processar geração se botão foi clicado
             if generate_button:
                 # Marcar como gerando
                 st.session_state.generating = True
 
-                # Validação com feedback visual melhorado
-                if not text_topic or not text_topic.strip():
+                # Validação única do tema (já retorna o tema sem espaços)
+                is_valid_topic, query = self.validate_topic(text_topic)
+                if not is_valid_topic:
                     st.session_state.generating = False
-                    st.error("Preencha o tema do post")
-                elif len(text_topic.strip()) < 5:
-                    st.session_state.generating = False
-                    st.warning("Tema muito curto (mín. 5 caracteres)")
-                elif len(text_topic.strip()) > 500:
-                    st.session_state.generating = False
-                    st.error("Tema muito longo (máx. 500 caracteres)")
+                    st.error("Informe um tema entre 5 e 500 caracteres")
                 else:
                     # Validação passou - processar geração
-                    query = text_topic.strip()
                     platform_code = selected_platform if (
                         selected_platform != "GENERIC"
                     ) else ""
 
                     try:
                         self._process_text_generation_improved(
-                            text_topic.strip(),
+                            query,
                             query,
                             platform_code,
                             selected_tone,
@@ -669,12 +948,8 @@ class Texts:
                         # Sempre limpar o estado de geração
                         st.session_state.generating = False
 
-        elif 'create' not in permissions:
-            st.warning("""
-            **🔒 Acesso Restrito**
-
-            Sem permissão para gerar posts.
-            """)
+        else:
+            st.warning(_CREATE_DENIED_MD)
 
     def render(self, token, menu_position, permissions):
         # menu_position não utilizado nesta função
@@ -688,24 +963,18 @@ class Texts:
             O token utilizado no envio da requisição.
         menu_position : Any
             posição do menu superior com a listagem dos posts.
-        permissions : list
-            Lista contendo as permissões do usuário.
+        permissions : int
+            Máscara de bits com as permissões do usuário.
         """
-        if 'read' in permissions:
+        if permissions & READ:
 
-            texts = TextsRequest().get_texts(token)
+            texts = _cached_get_texts(token)
 
             if not texts:
                 st.empty()
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
-                    st.info("""
-                    **📄 Biblioteca Vazia**
-
-                    Nenhum post foi encontrado. Que tal criar seu primeiro post?
-
-                    👉 Vá para **"🚀 Gerar Novo Post"** no menu acima.
-                    """)
+                    st.info(_EMPTY_LIBRARY_MD)
                 return
 
             # Cabeçalho da biblioteca
@@ -747,28 +1016,30 @@ class Texts:
                     help="Quantidade de posts por página"
                 )
 
-            # Aplicar filtros
-            filtered_texts = texts
-            if status_filter == "✅ Aprovados":
-                filtered_texts = [t for t in filtered_texts if t.get('is_approved', False)]
-            elif status_filter == "⏳ Pendentes":
-                filtered_texts = [t for t in filtered_texts if not t.get('is_approved', False)]
-
-            if search_text:
-                search_lower = search_text.lower()
+            # Sem filtros (visão padrão): nenhuma passagem sobre os posts
+            if status_filter == "Todos" and not search_text:
+                filtered_texts = texts
+            else:
+                # Aplicar filtros (status e busca) em uma única passagem
+                want_approved = status_filter == "✅ Aprovados"
+                want_pending = status_filter == "⏳ Pendentes"
+                needle = search_text.lower() if search_text else None
                 filtered_texts = [
-                    t for t in filtered_texts
-                    if search_lower in t.get('theme', '').lower() or
-                       search_lower in t.get('content', t.get('generated_text', '')).lower()
+                    t for t in texts
+                    if (not want_approved or t.get('is_approved', False)) and
+                       (not want_pending or not t.get('is_approved', False)) and
+                       (needle is None or
+                        needle in t['_theme_lc'] or
+                        needle in t['_content_lc'])
                 ]
 
             # Aplicar ordenação
             if sort_option == "📅 Mais Antigos":
                 filtered_texts.sort(key=lambda x: x.get('created_at', ''), reverse=False)
             elif sort_option == "📝 Mais Palavras":
-                filtered_texts.sort(key=lambda x: len(x.get('content', x.get('generated_text', '')).split()), reverse=True)
+                filtered_texts.sort(key=lambda x: self.text_service.count_words(_text_content(x)), reverse=True)
             elif sort_option == "📝 Menos Palavras":
-                filtered_texts.sort(key=lambda x: len(x.get('content', x.get('generated_text', '')).split()), reverse=False)
+                filtered_texts.sort(key=lambda x: self.text_service.count_words(_text_content(x)), reverse=False)
             else:  # Mais recentes (padrão)
                 filtered_texts.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
@@ -793,6 +1064,14 @@ class Texts:
 
             st.divider()
 
+            # Permissões avaliadas uma vez, fora do laço dos cards
+            can_update = bool(permissions & UPDATE)
+            can_create = bool(permissions & CREATE)
+
+            # Ações em lote sobre os posts selecionados
+            if can_update:
+                self._render_bulk_actions(token, texts)
+
             # Paginação
             total_posts = len(filtered_texts)
             total_pages = (total_posts - 1) // posts_per_page + 1 if total_posts > 0 else 1
@@ -814,149 +1093,270 @@ class Texts:
             end_idx = start_idx + posts_per_page
             posts_to_show = filtered_texts[start_idx:end_idx]
 
-            # Exibir posts com design melhorado
+            # Exibir posts com design melhorado (um fragmento por card)
             for i, text in enumerate(posts_to_show):
-                is_approved = text.get('is_approved', False)
-                status_emoji = '✅' if is_approved else '⏳'
-                status_color = 'success' if is_approved else 'warning'
+                self._render_text_card(
+                    token,
+                    text,
+                    can_update,
+                    can_create,
+                    f"{i}_{current_page}"
+                )
 
-                # Formatação da data melhorada
-                created_date = text.get('created_at', 'N/A')
-                if created_date != 'N/A' and len(created_date) >= 10:
-                    try:
-                        from datetime import datetime
-                        date_obj = datetime.strptime(created_date[:10], '%Y-%m-%d')
-                        formatted_date = date_obj.strftime('%d/%m/%Y')
-                        time_part = created_date[11:16] if len(created_date) > 16 else ''
-                        full_date = f"{formatted_date} {time_part}".strip()
-                    except Exception:
-                        full_date = created_date[:16] if len(created_date) >= 16 else created_date
-                else:
-                    full_date = 'Data não disponível'
+            # Navegação de páginas no final
+            if total_pages > 1:
+                col_nav1, col_nav2, col_nav3 = st.columns([1, 2, 1])
+                with col_nav2:
+                    st.info(f"📄 Mostrando posts {start_idx + 1} a {min(end_idx, total_posts)} de {total_posts}")
 
-                theme_display = text.get('theme', 'Sem título')
-                content_text = text.get('content', text.get('generated_text', ''))
-                word_count = len(content_text.split()) if content_text else 0
-                char_count = len(content_text) if content_text else 0
-                platform_name = PLATFORMS.get(text.get('platform', 'N/A'), 'Genérico')
+        else:
+            st.error(_READ_DENIED_MD)
 
-                # Preview do conteúdo (primeiras 150 caracteres)
-                content_preview = content_text[:150] + "..." if len(content_text) > 150 else content_text
+    @st.fragment
+    def _render_text_card(
+            self,
+            token,
+            text,
+            can_update,
+            can_create,
+            card_key):
+        """
+        Card de um post da biblioteca, com prévia e botões de ação.
 
-                # Container principal do post com design de card
-                text_id = text.get('id')
+        Executado como fragmento: interações dentro do card, incluindo
+        aprovar e reprovar, reexecutam apenas o próprio card. O novo
+        status é gravado em ``text`` para que o card o exiba sem
+        recarregar a página; os totais são atualizados no próximo rerun.
 
-                # Usar container com borda
-                with st.container():
-                    # Cabeçalho do card
-                    col_header, col_status = st.columns([4, 1])
+        Parameters
+        ----------
+        token : str
+            O token utilizado no envio da requisição.
+        text : dict
+            Os dados do post.
+        can_update : bool
+            Se o usuário pode aprovar/reprovar posts.
+        can_create : bool
+            Se o usuário pode gerar posts.
+        card_key : str
+            Sufixo único das chaves dos widgets do card.
+        """
+        is_approved = text.get('is_approved', False)
+        status_emoji, status_label = _CARD_STATUS[bool(is_approved)]
+
+        # Data ISO (AAAA-MM-DD...) convertida por fatias, sem strptime
+        created_date = text.get('created_at') or ''
+        if len(created_date) >= 10:
+            card_date = f"{created_date[8:10]}/{created_date[5:7]}/{created_date[:4]}"
+        else:
+            card_date = 'N/A'
+
+        # Campos do post lidos uma única vez por card
+        theme = text.get('theme', '')
+        theme_display = theme or 'Sem título'
+        content_text = _text_content(text)
+        char_count = len(content_text)
+        word_count = self.text_service.count_words(content_text)
+        platform_name = PLATFORMS.get(text.get('platform', 'N/A'), 'Genérico')
+
+        # Preview do conteúdo (primeiras 150 caracteres)
+        content_preview = content_text[:150] + "..." if char_count > 150 else content_text
+
+        # Container principal do post com design de card
+        text_id = text.get('id')
+
+        # Usar container com borda
+        with st.container():
+            # Cabeçalho do card
+            col_header, col_status = st.columns([4, 1])
+
+            with col_header:
+                st.markdown(f"### {status_emoji} {theme_display}")
+
+            with col_status:
+                if is_approved:
+                    st.success(status_label)
+                else:
+                    st.warning(status_label)
 
-                    with col_header:
-                        st.markdown(f"### {status_emoji} {theme_display}")
+            # Informações do post
+            col_info1, col_info2, col_info3, col_info4 = st.columns(4)
 
-                    with col_status:
-                        if is_approved:
-                            st.success("Aprovado")
-                        else:
-                            st.warning("Pendente")
+            with col_info1:
+                st.metric("📅 Data", card_date)
+
+            with col_info2:
+                st.metric("📱 Plataforma", platform_name)
 
-                    # Informações do post
-                    col_info1, col_info2, col_info3, col_info4 = st.columns(4)
+            with col_info3:
+                st.metric("📝 Palavras", word_count)
 
-                    with col_info1:
-                        st.metric("📅 Data", full_date[:10])
+            with col_info4:
+                st.metric("📊 Caracteres", char_count)
 
-                    with col_info2:
-                        st.metric("📱 Plataforma", platform_name)
+            # Preview do conteúdo (título e texto em um único elemento)
+            st.markdown(
+                f"**📄 Preview do Conteúdo:**\n\n*{content_preview}*"
+            )
 
-                    with col_info3:
-                        st.metric("📝 Palavras", word_count)
+            # Layout de ações
+            col_text, col_actions = st.columns([3, 1])
 
-                    with col_info4:
-                        st.metric("📊 Caracteres", char_count)
+            # Coluna esquerda: visualização completa do texto
+            with col_text:
+                with st.expander("👁️ Ver Texto Completo", expanded=False):
+                    st.text_area(
+                        "Conteúdo completo do post:",
+                        value=content_text,
+                        height=250,
+                        label_visibility="collapsed",
+                        key=f"post_text_{text_id}_{card_key}"
+                    )
 
-                    # Preview do conteúdo
-                    st.markdown("**📄 Preview do Conteúdo:**")
-                    st.markdown(f"*{content_preview}*")
+            # Coluna direita: botões de ação
+            with col_actions:
+                st.markdown("**🎛️ Ações:**")
 
-                    # Layout de ações
-                    col_text, col_actions = st.columns([3, 1])
+                if can_update:
+                    # O estado do widget é a seleção lida pelas ações em lote
+                    st.checkbox("Selecionar", key=f"select_text_{text_id}")
 
-                    # Coluna esquerda: visualização completa do texto
-                    with col_text:
-                        with st.expander("👁️ Ver Texto Completo", expanded=False):
-                            st.text_area(
-                                "Conteúdo completo do post:",
-                                value=content_text,
-                                height=250,
-                                label_visibility="collapsed",
-                                key=f"post_text_{text_id}_{i}_{current_page}"
+                if not is_approved and can_update:
+                    if st.button(
+                        "✅ Aprovar",
+                        key=f"approve_{text_id}_{card_key}",
+                        help="Aprovar este post",
+                        use_container_width=True,
+                        type="primary"
+                    ):
+                        with st.spinner("Aprovando post..."):
+                            result = shared_texts_request().approve_and_generate_embedding(
+                                token, text_id, content_text, theme
                             )
+                        if result["success"]:
+                            text['is_approved'] = True
+                        _clear_texts_cache()
+                        st.toast(result["message"], icon="✅")
+                        st.rerun(scope="fragment")
 
-                    # Coluna direita: botões de ação
-                    with col_actions:
-                        st.markdown("**🎛️ Ações:**")
-
-                        if not is_approved and 'update' in permissions:
-                            if st.button(
-                                "✅ Aprovar",
-                                key=f"approve_{text_id}_{i}_{current_page}",
-                                help="Aprovar este post",
-                                use_container_width=True,
-                                type="primary"
-                            ):
-                                with st.spinner("Aprovando post..."):
-                                    text_content = text.get('content', '')
-                                    text_theme = text.get('theme', '')
-                                    result = TextsRequest().approve_and_generate_embedding(
-                                        token, text_id, text_content, text_theme
-                                    )
-                                st.toast(result, icon="✅")
-                                st.rerun()
-
-                        elif is_approved and 'update' in permissions:
-                            if st.button(
-                                "❌ Reprovar",
-                                key=f"reject_{text_id}_{i}_{current_page}",
-                                help="Reprovar este post",
-                                use_container_width=True,
-                                type="secondary"
-                            ):
-                                with st.spinner("Reprovando post..."):
-                                    result = TextsRequest().reject_text(token, text_id)
-                                st.toast(result, icon="❌")
-                                st.rerun()
-
-                        if 'create' in permissions:
-                            if st.button(
-                                "🔄 Regenerar",
-                                key=f"regenerate_{text_id}_{i}_{current_page}",
-                                help="Regenerar post baseado neste tema",
-                                use_container_width=True,
-                                type="secondary"
-                            ):
-                                st.session_state.regenerate_text_data = {
-                                    'theme': text.get('theme', ''),
-                                    'original_id': text_id
-                                }
-                                st.toast("Tema carregado para regeneração!", icon="🔄")
-                                st.switch_page("🚀 Gerar Novo Post")
-
-                    st.divider()
+                elif is_approved and can_update:
+                    if st.button(
+                        "❌ Reprovar",
+                        key=f"reject_{text_id}_{card_key}",
+                        help="Reprovar este post",
+                        use_container_width=True,
+                        type="secondary"
+                    ):
+                        with st.spinner("Reprovando post..."):
+                            result = shared_texts_request().reject_text_via_webhook(
+                                text_id
+                            )
+                        if result["success"]:
+                            text['is_approved'] = False
+                        _clear_texts_cache()
+                        st.toast(result["message"], icon="❌")
+                        st.rerun(scope="fragment")
 
-            # Navegação de páginas no final
-            if total_pages > 1:
-                col_nav1, col_nav2, col_nav3 = st.columns([1, 2, 1])
-                with col_nav2:
-                    st.info(f"📄 Mostrando posts {start_idx + 1} a {min(end_idx, total_posts)} de {total_posts}")
+                if can_create:
+                    if st.button(
+                        "🔄 Regenerar",
+                        key=f"regenerate_{text_id}_{card_key}",
+                        help="Regenerar post baseado neste tema",
+                        use_container_width=True,
+                        type="secondary"
+                    ):
+                        st.session_state.regenerate_text_data = {
+                            'theme': theme,
+                            'original_id': text_id
+                        }
+                        st.toast("Tema carregado para regeneração!", icon="🔄")
+                        st.switch_page("🚀 Gerar Novo Post")
+
+            st.divider()
+
+    def _render_bulk_actions(self, token, texts):
+        """
+        Botões de aprovação e reprovação dos posts selecionados, com as
+        requisições enviadas em paralelo.
+
+        Parameters
+        ----------
+        token : str
+            O token utilizado no envio da requisição.
+        texts : list
+            Os posts da biblioteca.
+        """
+        texts_by_id = {text.get('id'): text for text in texts}
 
-        elif 'read' not in permissions:
-            st.error("""
-            **🔒 Acesso Restrito**
+        col_count, col_approve, col_reject = st.columns([2, 1, 1])
 
-            Você não possui permissão para visualizar posts.
-            Entre em contato com o administrador para solicitar acesso.
-            """)
+        with col_count:
+            st.markdown("**☑️ Ações em lote nos posts selecionados**")
+
+        with col_approve:
+            approve_selected = st.button(
+                "✅ Aprovar selecionados",
+                key="bulk_approve",
+                use_container_width=True,
+                type="primary"
+            )
+
+        with col_reject:
+            reject_selected = st.button(
+                "❌ Reprovar selecionados",
+                key="bulk_reject",
+                use_container_width=True,
+                type="secondary"
+            )
+
+        if not (approve_selected or reject_selected):
+            return
+
+        # Os checkboxes dos cards (fragmentos) são a única fonte da seleção
+        selected_ids = [
+            text_id for text_id in texts_by_id
+            if st.session_state.get(f"select_text_{text_id}")
+        ]
+        if not selected_ids:
+            st.toast("Nenhum post selecionado", icon="ℹ️")
+            return
+
+        texts_api = shared_texts_request()
+        if approve_selected:
+            def review(text_id):
+                text = texts_by_id[text_id]
+                return texts_api.approve_and_generate_embedding(
+                    token,
+                    text_id,
+                    _text_content(text),
+                    text.get('theme', '')
+                )
+            spinner_text = "Aprovando posts selecionados..."
+        else:
+            def review(text_id):
+                return texts_api.reject_text_via_webhook(text_id)
+            spinner_text = "Reprovando posts selecionados..."
+
+        # Requisições independentes (I/O): enviadas em paralelo
+        with st.spinner(spinner_text):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(review, selected_ids))
+
+        failures = [
+            result["message"] for result in results if not result["success"]
+        ]
+        for message in failures:
+            logger.error(f"Bulk review error: {message}")
+
+        for text_id in selected_ids:
+            st.session_state.pop(f"select_text_{text_id}", None)
+        _clear_texts_cache()
+        st.toast(
+            f"{len(results) - len(failures)} de {len(results)} "
+            "post(s) processado(s)",
+            icon="✅" if not failures else "⚠️"
+        )
+        st.rerun()
 
     def update(self, token, menu_position, permissions):
         """
@@ -968,46 +1368,51 @@ class Texts:
             O token utilizado no envio da requisição.
         menu_position : Any
             posição do menu superior com a listagem dos posts.
-        permissions : list
-            Lista contendo as permissões do usuário.
+        permissions : int
+            Máscara de bits com as permissões do usuário.
         """
 
-        if 'update' in permissions:
-            texts = TextsRequest().get_texts(token)
-
-            if not texts:
-                _, col5, _ = st.columns(3)
-                with col5:
-                    st.info("""
-                    **📄 Nenhum post encontrado**
+        if not permissions & UPDATE:
+            st.warning(_UPDATE_DENIED_MD)
+            return
+
+        texts = _cached_get_texts(token)
+
+        if not texts:
+            _, col5, _ = st.columns(3)
+            with col5:
+                st.info(_NO_POSTS_TO_EDIT_MD)
+            return
+
+        # Seleção do post no menu superior
+        with menu_position:
+            st.markdown("### 🎯 Selecionar Post")
+            texts_options = {
+                f"{text['theme'][:50]}"
+                f"{'...' if len(text['theme']) > 50 else ''} "
+                f"({'Aprovado' if text.get('is_approved') else 'Pendente'})":
+                    text['id']
+                for text in texts
+            }
 
-                    Não há posts para edição.
-                    """)
-                return
+            selected_text_display = st.selectbox(
+                "Escolha o post para editar:",
+                options=list(texts_options.keys()),
+                help="Selecione um post"
+            )
+            selected_text_id = texts_options[selected_text_display]
 
-            # Seleção do post no menu superior
-            with menu_position:
-                st.markdown("### 🎯 Selecionar Post")
-                texts_options = {}
-                for text in texts:
-                    theme_preview = text['theme'][:50]
-                    theme_preview += '...' if len(text['theme']) > 50 else ''
-                    status = ('Aprovado' if text.get('is_approved')
-                              else 'Pendente')
-                    key = f"{theme_preview} ({status})"
-                    texts_options[key] = text['id']
-
-                selected_text_display = st.selectbox(
-                    "Escolha o post para editar:",
-                    options=list(texts_options.keys()),
-                    help="Selecione um post"
-                )
-                selected_text_id = texts_options[selected_text_display]
+        # Interface de edição
+        text_data = _cached_get_text(token, selected_text_id)
 
-            # Interface de edição
-            text_data = TextsRequest().get_text(token, selected_text_id)
+        if text_data:
+            status_options = {
+                True: "✅ Aprovado",
+                False: "⏳ Pendente"
+            }
 
-            if text_data:
+            # Edição agrupada em formulário: um único rerun por envio
+            with st.form("edit_text_form", clear_on_submit=False):
                 col_form, col_preview = st.columns([1, 1])
 
                 with col_form:
@@ -1021,11 +1426,6 @@ class Texts:
                         height=100
                     )
 
-                    status_options = {
-                        True: "✅ Aprovado",
-                        False: "⏳ Pendente"
-                    }
-
                     current_approval_status = text_data.get(
                         'is_approved', False)
 
@@ -1040,95 +1440,82 @@ class Texts:
                     new_approval_status = new_status_display == "✅ Aprovado"
 
                 with col_preview:
-
-                    st.subheader("👁️ Prévia das Alterações")
-
-                    # Verificar se houve mudanças
-                    has_changes = (
-                        new_topic != text_data['theme'] or
-                        new_approval_status != text_data.get('is_approved'))
-
-                    if has_changes:
-                        st.toast("Alterações detectadas!", icon="📝")
-                    else:
-                        st.toast("Nenhuma alteração feita", icon="ℹ️")
-
+                    # Cabeçalho e prévia enviados em um único markdown
+                    preview_parts = ["### 👁️ Prévia das Alterações"]
                     if new_topic:
                         topic_preview = (new_topic[:200]
                                          if len(new_topic) > 200
                                          else new_topic)
                         topic_suffix = '...' if len(new_topic) > 200 else ''
-                        st.markdown(f"""
-                        **🎯 Novo Tema:**
-                        {topic_preview}{topic_suffix}
-
-                        **📊 Novo Status:**
-                        {status_options[new_approval_status]}
-
-                        **📅 Data Original:**
-                        {text_data.get('created_at', 'N/A')[:10]}
-
-                        **📊 Caracteres:** {len(new_topic)}/500""")
-
-                # Validação e botão de atualização
-                if new_topic:
-                    validated_topic, topic_data = self.validate_topic(
-                        new_topic)
-
-                    if validated_topic and has_changes:
-                        _, col_btn2, _ = st.columns([1, 2, 1])
-
-                        with col_btn2:
-                            confirm_button = st.button(
-                                "💾 Salvar Alterações",
-                                use_container_width=True,
-                                type="primary",
-                                help="Salvar alterações"
-                            )
-
-                            if confirm_button:
-                                new_text_data = {
-                                    "theme": topic_data,
-                                    "is_approved": new_approval_status
-                                }
-
-                                with st.spinner("Salvando alterações..."):
-                                    returned_text = TextsRequest().update_text(
-                                        token=token,
-                                        text_id=text_data['id'],
-                                        updated_data=new_text_data
-                                    )
-
-                                st.toast(
-                                    "Post atualizado com sucesso!",
-                                    icon="✅"
-                                )
-                                st.balloons()
-                                st.toast(returned_text, icon="ℹ️")
-                                st.rerun()
-
-                # Área de prévia do post completo
-                with st.expander(
-                    "📄 Visualizar Post Completo",
-                    expanded=False
-                ):
-                    content_text = text_data.get(
-                        'content', text_data.get(
-                            'generated_text', 'Post não disponível'))
+                        preview_parts.extend([
+                            "**🎯 Novo Tema:**\n"
+                            f"{topic_preview}{topic_suffix}",
+                            "**📊 Novo Status:**\n"
+                            f"{status_options[new_approval_status]}",
+                            "**📅 Data Original:**\n"
+                            f"{text_data.get('created_at', 'N/A')[:10]}",
+                            _COUNTER_TMPL.format(len(new_topic)),
+                        ])
+                    st.markdown("\n\n".join(preview_parts))
+
+                _, col_btn2, _ = st.columns([1, 2, 1])
+
+                with col_btn2:
+                    confirm_button = st.form_submit_button(
+                        "💾 Salvar Alterações",
+                        use_container_width=True,
+                        type="primary",
+                        help="Salvar alterações"
+                    )
 
-                    st.text_area(
-                        "Conteúdo completo do post:",
-                        value=content_text,
-                        height=400,
-                        label_visibility="collapsed"
+            # Validação executada apenas no envio do formulário
+            if confirm_button:
+                has_changes = (
+                    new_topic != text_data['theme'] or
+                    new_approval_status != text_data.get('is_approved'))
+                validated_topic, topic_data = self.validate_topic(
+                    new_topic)
+
+                if not has_changes:
+                    st.toast("Nenhuma alteração feita", icon="ℹ️")
+                elif not validated_topic:
+                    st.toast(
+                        "Tema inválido (entre 5 e 500 caracteres)",
+                        icon="⚠️"
                     )
+                else:
+                    new_text_data = {
+                        "theme": topic_data,
+                        "is_approved": new_approval_status
+                    }
 
-        elif 'update' not in permissions:
-            st.warning("""
-            **🔒 Acesso Restrito**
+                    with st.spinner("Salvando alterações..."):
+                        returned_text = shared_texts_request().update_text(
+                            token=token,
+                            text_id=text_data['id'],
+                            updated_data=new_text_data
+                        )
 
-            Sem permissão para atualizar posts.
-            """)
+                    _clear_texts_cache()
+                    st.toast(
+                        f"Post atualizado — {returned_text}",
+                        icon="🎉"
+                    )
+                    st.rerun()
+
+            # Área de prévia do post completo
+            with st.expander(
+                "📄 Visualizar Post Completo",
+                expanded=False
+            ):
+                content_text = _text_content(text_data) or _NO_CONTENT
+
+                st.text_area(
+                    "Conteúdo completo do post:",
+                    value=content_text,
+                    height=400,
+                    label_visibility="collapsed"
+                )
 
     def main_menu(self, token, permissions):
         """
@@ -1141,9 +1528,7 @@ class Texts:
         permissions : str
             Lista com as permissões do usuário.
         """
-        class_permissions = TextsRequest().get_text_permissions(
-            user_permissions=permissions
-        )
+        class_permissions = _permission_bits(permissions)
 
         # Cabeçalho principal mais limpo
         _, col_menu, col_actions = st.columns([1, 1.2, 1])
@@ -1151,42 +1536,32 @@ class Texts:
         with col_menu:
             # Menu com ícones mais intuitivos
             menu_options = {
-                "📚 Biblioteca de Posts": self.render,
-                "🚀 Gerar Novo Post": self.create,
+                MenuAction.LIBRARY: self.render,
+                MenuAction.CREATE: self.create,
             }
 
             # Verificar permissões e filtrar opções disponíveis
-            available_options = {}
-            if 'read' in class_permissions:
-                available_options["📚 Biblioteca de Posts"] = (
-                    menu_options["📚 Biblioteca de Posts"]
-                )
-            if 'create' in class_permissions:
-                available_options["🚀 Gerar Novo Post"] = (
-                    menu_options["🚀 Gerar Novo Post"]
-                )
+            available_options = {
+                action: method for action, method in menu_options.items()
+                if class_permissions & _ACTION_PERMISSIONS[action]
+            }
 
             if available_options:
-                selected_option = st.selectbox(
+                st.selectbox(
                     label="Escolha uma ação:",
                     options=list(available_options.keys()),
+                    format_func=_ACTION_LABELS.__getitem__,
                     help="Selecione uma opção",
+                    key="texts_main_menu_choice",
                     label_visibility="collapsed"
                 )
+                selected_option = st.session_state["texts_main_menu_choice"]
             else:
                 st.toast(
                     "Você não possui permissões para usar esta funcionalidade",
                     icon="❌")
                 return
 
-        # Mostrar informações de permissão
-        with col_actions:
-            permission_status = []
-            if 'read' in class_permissions:
-                permission_status.append("👁️ Visualizar")
-            if 'create' in class_permissions:
-                permission_status.append("➕ Criar")
-
         st.divider()
 
         # Executar a opção selecionada
@@ -1,5 +1,106 @@
+import hashlib
+import threading
+import uuid
+from functools import lru_cache
+import httpx
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dictionary.vars import API_BASE_URL
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Endereços da API montados uma única vez
+_TEXTS_URL = f"{API_BASE_URL}/texts/"
+_WEBHOOK_APPROVAL_URL = f"{API_BASE_URL}/webhook/approval/"
+_EMBEDDINGS_URL = f"{API_BASE_URL}/embeddings/"
+
+# Permissões Django do app de textos, na ordem em que são retornadas
+_PERMISSION_MAP = {
+    "texts.add_text": "create",
+    "texts.view_text": "read",
+    "texts.change_text": "update",
+    "texts.delete_text": "delete",
+}
+
+# Mensagens de update_text por código de retorno
+_UPDATE_SUCCESS_CODES = frozenset([200, 204])
+_UPDATE_MESSAGES = {
+    200: ":white_check_mark: Texto atualizado.",
+    204: ":white_check_mark: Texto atualizado.",
+    400: "Dados inválidos para atualização.",
+    404: "Texto não encontrado.",
+}
+
+
+# Novas tentativas com backoff exponencial para falhas transitórias (5xx e
+# conexão). POST fica de fora: criar um texto duas vezes não é seguro.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    raise_on_status=False
+)
+
+# Os webhooks de aprovação são idempotentes (id + status): POST incluído
+_WEBHOOK_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False
+)
+
+
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada, criada na primeira requisição.
+    Reaproveita conexões (keep-alive) entre as requisições, evitando um
+    novo handshake TCP/TLS a cada chamada.
+
+    Returns
+    -------
+    requests.Session
+        Sessão única, com pool de conexões e novas tentativas.
+    """
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+    # O prefixo mais específico prevalece sobre http:// e https://
+    session.mount(f"{API_BASE_URL}/webhook/", HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=_WEBHOOK_RETRY))
+    return session
+
+
+def _parse_error(response):
+    """
+    Extrai o corpo de uma resposta de erro, decodificando JSON apenas
+    quando o corpo existe e é declarado como JSON.
+
+    Parameters
+    ----------
+    response : requests.Response | httpx.Response
+        A resposta com erro.
+
+    Returns
+    -------
+    error_body : dict | list | str
+        O JSON decodificado ou o texto da resposta.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    if not response.content or "json" not in content_type:
+        return response.text or ""
+
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
 
 
 class TextsRequest:
@@ -7,6 +108,22 @@ class TextsRequest:
     Classe responsável pelas requisições referentes aos textos.
     """
 
+    # Limite de respostas guardadas para requisições condicionais
+    _MAX_ETAG_ENTRIES = 256
+
+    # Tempos limite (conexão, leitura) em segundos: uma API inacessível
+    # falha em ~3 s, sem consumir o orçamento de leitura
+    _TIMEOUT = (3.05, 27)
+    _FAST_TIMEOUT = (3.05, 10)  # Webhooks de aprovação
+    _SLOW_TIMEOUT = (3.05, 57)  # Geração de embeddings
+
+    def __init__(self):
+        """
+        Inicializa o cache de respostas (ETag) das consultas.
+        """
+        self._etag_cache = {}
+        self._cache_lock = threading.Lock()
+
     def get_text_permissions(self, user_permissions):
         """
         Consulta e retorna as permissões do usuário.
@@ -22,20 +139,16 @@ class TextsRequest:
             A lista de permissões do usuário para a aplicação de textos.
         """
 
-        text_permissions = []
-
         # Verificar se user_permissions não é None
         if user_permissions is None:
-            return text_permissions
+            return []
 
-        if "texts.add_text" in user_permissions:
-            text_permissions.append('create')
-        if "texts.view_text" in user_permissions:
-            text_permissions.append('read')
-        if "texts.change_text" in user_permissions:
-            text_permissions.append('update')
-        if "texts.delete_text" in user_permissions:
-            text_permissions.append('delete')
+        # Uma única conversão para conjunto, em vez de quatro buscas na lista
+        user_set = set(user_permissions)
+        text_permissions = [
+            permission for django_permission, permission
+            in _PERMISSION_MAP.items() if django_permission in user_set
+        ]
 
         return text_permissions
 
@@ -53,17 +166,7 @@ class TextsRequest:
         texts_dataframe : Any
             O dado obtido com base na requisição.
         """
-        texts_dataframe = []
-
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            f"""{API_BASE_URL}/texts/""",
-            headers=headers
-        )
-        if response.status_code == 200:
-            texts_dataframe = response.json()
-        else:
-            texts_dataframe = None
+        texts_dataframe = self._conditional_get(token, _TEXTS_URL)
 
         return texts_dataframe
 
@@ -83,20 +186,135 @@ class TextsRequest:
         text_data : dict
             O dicionário obtido com base na requisição.
         """
-        text_data = {}
-
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            f"""{API_BASE_URL}/texts/{text_id}/""",
-            headers=headers
-        )
-        if response.status_code == 200:
-            text_data = response.json()
-        else:
-            text_data = None
+        text_data = self._conditional_get(token, f"{_TEXTS_URL}{text_id}/")
 
         return text_data
 
+    def _token_hash(self, token):
+        """
+        Resume o token para uso em chaves de cache, sem guardá-lo em claro.
+
+        Parameters
+        ----------
+        token : str
+            Token de autenticação.
+
+        Returns
+        -------
+        str
+            Hash curto do token.
+        """
+        return hashlib.blake2b(
+            str(token).encode(),
+            digest_size=8
+        ).hexdigest()
+
+    def _invalidate_cache(self, text_id=None):
+        """
+        Remove do cache de ETags a listagem e, se informado, o texto
+        alterado.
+
+        Parameters
+        ----------
+        text_id : int
+            Número identificador do texto alterado (opcional).
+        """
+        stale_urls = {_TEXTS_URL}
+        if text_id is not None:
+            stale_urls.add(f"{_TEXTS_URL}{text_id}/")
+
+        with self._cache_lock:
+            for cache_key in list(self._etag_cache.keys()):
+                if cache_key[1] in stale_urls:
+                    self._etag_cache.pop(cache_key, None)
+
+    def _conditional_get(self, token, url):
+        """
+        Faz uma consulta condicional (If-None-Match), reaproveitando a
+        resposta anterior quando a API responde 304 Not Modified.
+
+        Parameters
+        ----------
+        token : str
+            Token utilizado na requisição de consulta.
+        url : str
+            Endereço consultado.
+
+        Returns
+        -------
+        response : Any
+            O JSON da resposta, ou None em caso de erro.
+        """
+        headers = {}
+
+        cache_key = (self._token_hash(token), url)
+        with self._cache_lock:
+            cached = self._etag_cache.get(cache_key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = self._request("GET", url, token=token, headers=headers)
+
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        if response.status_code != 200:
+            return None
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                if len(self._etag_cache) >= self._MAX_ETAG_ENTRIES:
+                    self._etag_cache.clear()
+                self._etag_cache[cache_key] = (etag, payload)
+
+        return payload
+
+    def _request(
+            self,
+            method,
+            url,
+            token=None,
+            json_body=None,
+            headers=None,
+            timeout=None):
+        """
+        Envia uma requisição à API pela sessão compartilhada, com
+        autenticação, corpo JSON e tempo limite padronizados.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP (GET, POST, PUT, DELETE).
+        url : str
+            Endereço da requisição.
+        token : str
+            Token de autenticação (opcional, para os webhooks).
+        json_body : dict
+            Corpo da requisição, enviado como JSON (opcional).
+        headers : dict
+            Cabeçalhos adicionais (opcional).
+        timeout : tuple
+            Tempos limite (conexão, leitura); padrão ``_TIMEOUT``.
+
+        Returns
+        -------
+        response : requests.Response
+            A resposta da requisição.
+        """
+        request_headers = dict(headers) if headers else {}
+        if token is not None:
+            request_headers["Authorization"] = f"Bearer {token}"
+
+        return _shared_session().request(
+            method,
+            url,
+            headers=request_headers,
+            json=json_body,
+            timeout=timeout or self._TIMEOUT
+        )
+
     def create_text(self, token, text_data):
         """
         Envia e cria o texto por meio da requisição.
@@ -119,44 +337,104 @@ class TextsRequest:
             "text_id": None
         }
 
+        try:
+            response = self._request(
+                "POST",
+                _TEXTS_URL,
+                token=token,
+                json_body=text_data
+            )
+            result = self._create_result(response)
+            if result["success"]:
+                self._invalidate_cache()
+
+        except requests.exceptions.RequestException as e:
+            result["message"] = f"Erro de conexão com a API: {str(e)}"
+
+        return result
+
+    async def create_text_async(self, token, text_data):
+        """
+        Versão assíncrona de create_text, baseada em httpx.AsyncClient.
+
+        Parameters
+        ----------
+        token : str
+            Token utilizado para o envio da requisição.
+        text_data: dict
+            Dicionário com os dados do texto.
+
+        Returns
+        -------
+        response : dict
+            Dicionário com a resposta da requisição e ID do texto criado.
+        """
+        result = {
+            "success": False,
+            "message": "",
+            "text_id": None
+        }
+
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
 
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/texts/",
-                headers=headers,
-                json=text_data,
-                timeout=30
-            )
-
-            if response.status_code == 201:
-                response_data = response.json()
-                result["success"] = True
-                result["message"] = "✅ Texto registrado com sucesso!"
-                result["text_id"] = response_data.get("id")
-            else:
-                # Log detalhado do erro
-                error_detail = ""
-                try:
-                    error_data = response.json()
-                    error_detail = str(error_data)
-                except Exception:
-                    error_detail = response.text
-
-                result["message"] = (
-                    f"Erro ao registrar texto na API. "
-                    f"Status: {response.status_code}. "
-                    f"Detalhes: {error_detail}"
+            async with httpx.AsyncClient(
+                timeout=self._async_timeout()
+            ) as client:
+                response = await client.post(
+                    _TEXTS_URL,
+                    headers=headers,
+                    json=text_data
                 )
+            result = self._create_result(response)
+            if result["success"]:
+                self._invalidate_cache()
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             result["message"] = f"Erro de conexão com a API: {str(e)}"
 
         return result
 
+    def _create_result(self, response):
+        """
+        Monta o resultado da criação de texto a partir da resposta.
+
+        Parameters
+        ----------
+        response : requests.Response | httpx.Response
+            A resposta da requisição de criação.
+
+        Returns
+        -------
+        response : dict
+            Dicionário com a resposta da requisição e ID do texto criado.
+        """
+        result = {
+            "success": False,
+            "message": "",
+            "text_id": None
+        }
+
+        if response.status_code == 201:
+            response_data = response.json()
+            result["success"] = True
+            result["message"] = "✅ Texto registrado com sucesso!"
+            result["text_id"] = response_data.get("id")
+        else:
+            # Log detalhado do erro
+            error_detail = str(_parse_error(response))
+
+            result["message"] = (
+                f"Erro ao registrar texto na API. "
+                f"Status: {response.status_code}. "
+                f"Detalhes: {error_detail}"
+            )
+
+        return result
+
     def update_text(self, token, text_id, updated_data):
         """
         Faz a atualização do texto com base no identificador, token e dados.
@@ -175,29 +453,65 @@ class TextsRequest:
         response : str
             A resposta da requisição.
         """
-        return_text = ""
+        response = self._request(
+            "PUT",
+            f"{_TEXTS_URL}{text_id}/",
+            token=token,
+            json_body=updated_data
+        )
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        if response.status_code in _UPDATE_SUCCESS_CODES:
+            self._invalidate_cache(text_id)
 
-        response = requests.put(
-            f"{API_BASE_URL}/texts/{text_id}/",
-            headers=headers,
-            json=updated_data
-        )
+        return self._update_message(response.status_code)
 
-        if response.status_code in [200, 204]:
-            return_text = ":white_check_mark: Texto atualizado."
-        elif response.status_code == 400:
-            return_text = "Dados inválidos para atualização."
-        elif response.status_code == 404:
-            return_text = "Texto não encontrado."
-        else:
-            return_text = "Erro desconhecido."
+    def _idempotency_key(self, action, text_id):
+        """
+        Gera uma chave de idempotência nova para uma ação de webhook. Cada
+        clique gera sua própria chave; apenas as retentativas da mesma
+        requisição (que reenviam os mesmos cabeçalhos) a repetem.
 
-        return return_text
+        Parameters
+        ----------
+        action : str
+            Ação do webhook (approve ou reject).
+        text_id : int
+            Número de identificação do texto.
+
+        Returns
+        -------
+        str
+            Chave enviada no cabeçalho Idempotency-Key.
+        """
+        return f"{action}-{text_id}-{uuid.uuid4()}"
+
+    def _async_timeout(self):
+        """
+        Converte o tempo limite padrão para o formato do httpx.
+
+        Returns
+        -------
+        httpx.Timeout
+            Tempos limite de conexão e leitura.
+        """
+        connect_timeout, read_timeout = self._TIMEOUT
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+
+    def _update_message(self, status_code):
+        """
+        Converte o código de retorno da atualização em mensagem.
+
+        Parameters
+        ----------
+        status_code : int
+            Código de retorno da requisição.
+
+        Returns
+        -------
+        response : str
+            Mensagem correspondente ao código.
+        """
+        return _UPDATE_MESSAGES.get(status_code, "Erro desconhecido.")
 
     def delete_text(self, token, text_id):
         """
@@ -217,17 +531,19 @@ class TextsRequest:
         """
         returned_text = None
 
-        headers = {"Authorization": f"Bearer {token}"}
-
-        response = requests.delete(
-            f"{API_BASE_URL}/texts/{text_id}/",
-            headers=headers
+        response = self._request(
+            "DELETE",
+            f"{_TEXTS_URL}{text_id}/",
+            token=token
         )
 
         if response.status_code == 204:
-            returned_text = """:white_check_mark: Texto excluído."""
+            self._invalidate_cache(text_id)
+            returned_text = ":white_check_mark: Texto excluído."
         else:
-            returned_text = response
+            returned_text = (
+                f"Erro ao excluir texto (status {response.status_code})."
+            )
 
         return returned_text
 
@@ -271,10 +587,6 @@ class TextsRequest:
             "message": ""
         }
 
-        headers = {
-            "Content-Type": "application/json"
-        }
-
         # Usar webhook de aprovação (sem autenticação)
         webhook_data = {
             "id": text_id,
@@ -282,24 +594,31 @@ class TextsRequest:
         }
 
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/webhook/approval/",
-                headers=headers,
-                json=webhook_data,
-                timeout=30
+            response = self._request(
+                "POST",
+                _WEBHOOK_APPROVAL_URL,
+                json_body=webhook_data,
+                headers={
+                    "Idempotency-Key": self._idempotency_key(
+                        "approve", text_id)
+                },
+                timeout=self._FAST_TIMEOUT
             )
 
             if response.status_code == 200:
+                self._invalidate_cache(text_id)
                 result["success"] = True
                 result["message"] = "✅ Texto aprovado com sucesso!"
             elif response.status_code == 400:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("error", "Dados inválidos")
+                error_data = _parse_error(response)
+                error_msg = (error_data.get("error", "Dados inválidos")
+                             if isinstance(error_data, dict)
+                             else error_data or "Dados inválidos")
                 result["message"] = f"❌ Erro na aprovação: {error_msg}"
             else:
-                result[
-                    "message"
-                ] = f"""❌ Erro na aprovação. Status: {response.status_code}"""
+                result["message"] = (
+                    f"❌ Erro na aprovação. Status: {response.status_code}"
+                )
 
         except requests.exceptions.RequestException as e:
             result["message"] = f"❌ Erro de conexão: {str(e)}"
@@ -329,11 +648,6 @@ class TextsRequest:
             "message": ""
         }
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
         # Dados para criação do embedding
         embedding_data = {
             "origin": "generated",
@@ -346,22 +660,22 @@ class TextsRequest:
         }
 
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/embeddings/",
-                headers=headers,
-                json=embedding_data,
-                timeout=30
+            response = self._request(
+                "POST",
+                _EMBEDDINGS_URL,
+                token=token,
+                json_body=embedding_data,
+                timeout=self._SLOW_TIMEOUT
             )
 
             if response.status_code == 201:
                 result["success"] = True
                 result["message"] = "✅ Embedding gerado com sucesso!"
             else:
-                result[
-                    "message"
-                ] = f"""❌ Erro na geração do embedding. Status: {
-                    response.status_code
-                }"""
+                result["message"] = (
+                    "❌ Erro na geração do embedding. "
+                    f"Status: {response.status_code}"
+                )
 
         except requests.exceptions.RequestException as e:
             result["message"] = f"❌ Erro de conexão: {str(e)}"
@@ -391,14 +705,15 @@ class TextsRequest:
 
         Returns
         -------
-        response : str
-            Mensagem de resultado da operação.
+        response : dict
+            Dicionário com resultado da operação; ``success`` indica se
+            o texto foi aprovado, mesmo que o embedding falhe.
         """
         # Primeiro aprova o texto via webhook
         approval_result = self.approve_text_via_webhook(text_id)
 
         if not approval_result["success"]:
-            return approval_result["message"]
+            return approval_result
 
         # Depois gera o embedding
         embedding_result = self.generate_embedding(
@@ -408,11 +723,16 @@ class TextsRequest:
         )
 
         if embedding_result["success"]:
-            return "✅ Texto aprovado e embedding gerado com sucesso!"
+            approval_result["message"] = (
+                "✅ Texto aprovado e embedding gerado com sucesso!"
+            )
         else:
-            return f"""✅ Texto aprovado, mas erro no embedding: {
-                embedding_result['message']
-            }"""
+            approval_result["message"] = (
+                "✅ Texto aprovado, mas erro no embedding: "
+                f"{embedding_result['message']}"
+            )
+
+        return approval_result
 
     def reject_text_via_webhook(self, text_id):
         """
@@ -425,11 +745,12 @@ class TextsRequest:
 
         Returns
         -------
-        response : str
-            A resposta da requisição.
+        response : dict
+            Dicionário com resultado da operação.
         """
-        headers = {
-            "Content-Type": "application/json"
+        result = {
+            "success": False,
+            "message": ""
         }
 
         # Usar webhook de aprovação com status False para reprovar
@@ -439,24 +760,36 @@ class TextsRequest:
         }
 
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/webhook/approval/",
-                headers=headers,
-                json=webhook_data,
-                timeout=30
+            response = self._request(
+                "POST",
+                _WEBHOOK_APPROVAL_URL,
+                json_body=webhook_data,
+                headers={
+                    "Idempotency-Key": self._idempotency_key(
+                        "reject", text_id)
+                },
+                timeout=self._FAST_TIMEOUT
             )
 
             if response.status_code == 200:
-                return "❌ Texto reprovado com sucesso!"
+                self._invalidate_cache(text_id)
+                result["success"] = True
+                result["message"] = "❌ Texto reprovado com sucesso!"
             elif response.status_code == 400:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("error", "Dados inválidos")
-                return f"❌ Erro na reprovação: {error_msg}"
+                error_data = _parse_error(response)
+                error_msg = (error_data.get("error", "Dados inválidos")
+                             if isinstance(error_data, dict)
+                             else error_data or "Dados inválidos")
+                result["message"] = f"❌ Erro na reprovação: {error_msg}"
             else:
-                return f"❌ Erro na reprovação. Status: {response.status_code}"
+                result["message"] = (
+                    f"❌ Erro na reprovação. Status: {response.status_code}"
+                )
 
         except requests.exceptions.RequestException as e:
-            return f"❌ Erro de conexão: {str(e)}"
+            result["message"] = f"❌ Erro de conexão: {str(e)}"
+
+        return result
 
     def reject_text(self, token, text_id):
         """
@@ -476,4 +809,20 @@ class TextsRequest:
             A resposta da requisição.
         """
         # Usar webhook para reprovação
-        return self.reject_text_via_webhook(text_id)
+        rejection_result = self.reject_text_via_webhook(text_id)
+        return rejection_result["message"]
+
+
+@st.cache_resource
+def shared_texts_request() -> TextsRequest:
+    """
+    Retorna a instância de TextsRequest compartilhada entre páginas,
+    reruns e sessões, para que uma escrita em qualquer página invalide o
+    mesmo cache de consultas.
+
+    Returns
+    -------
+    TextsRequest
+        Instância única para as requisições de textos.
+    """
+    return TextsRequest()
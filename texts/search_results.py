@@ -1,10 +1,293 @@
 import streamlit as st
-from typing import List, Dict
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import logging
 import html
 
 logger = logging.getLogger(__name__)
 
+_RESULTS_PER_PAGE = 10
+
+# Ícones do cabeçalho de cada tipo de resultado
+_TYPE_ICONS = {
+    'Post Gerado': '📝',
+    'Consultoria Comercial': '💼',
+    'Reunião de Consultores': '🤝',
+    'Base de Conhecimento': '📚',
+    'Embedding': '🧠'
+}
+
+# Opções dos filtros da busca por metadados
+_PLATFORM_OPTIONS = (
+    "", "Facebook", "Instagram", "LinkedIn", "TikTok", "Twitter", "YouTube"
+)
+_ORIGIN_OPTIONS = ("", "webscraping", "generated", "business_brain", "manual")
+_CONTENT_TYPE_OPTIONS = ("", "post", "article", "video", "image", "text")
+
+
+@st.cache_resource
+def _embeddings_service():
+    """
+    Instância do serviço de embeddings compartilhada entre sessões e
+    reexecuções da página.
+    """
+    from services.embeddings_service import EmbeddingsService
+    return EmbeddingsService()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _embeddings_api_available() -> bool:
+    """
+    Verifica a disponibilidade da API de embeddings, com cache de 30
+    segundos para não repetir a requisição a cada reexecução da página.
+
+    Returns
+    -------
+    bool
+        True se a API está disponível
+    """
+    return _embeddings_service().health_check()
+
+
+def _freeze_filters(filters: Dict) -> Tuple:
+    """
+    Converte os filtros de metadados em uma tupla ordenada, utilizável
+    como chave de cache.
+
+    Parameters
+    ----------
+    filters : Dict
+        Filtros de metadados
+
+    Returns
+    -------
+    Tuple
+        Pares (filtro, valor) ordenados pelo nome do filtro
+    """
+    return tuple(sorted(
+        (key, tuple(sorted(value.items())) if isinstance(value, dict)
+         else value)
+        for key, value in filters.items()
+    ))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_results(
+    query: str,
+    filters: Tuple,
+    size: int
+) -> List[Dict]:
+    """
+    Consulta embeddings por texto e filtros com cache por 5 minutos, para
+    que reexecuções da página (ordenação, modo de visualização) e buscas
+    repetidas não voltem à API.
+
+    Parameters
+    ----------
+    query : str
+        Texto para busca de similares
+    filters : Tuple
+        Filtros de metadados congelados por ``_freeze_filters``
+    size : int
+        Número máximo de resultados
+
+    Returns
+    -------
+    List[Dict]
+        Resultados ordenados por relevância, sem ids repetidos
+    """
+    filters_dict = {
+        key: dict(value) if isinstance(value, tuple) else value
+        for key, value in filters
+    }
+    return _deduplicate_by_id(
+        _embeddings_service().query_embeddings_by_text(
+            query, size, filters_dict or None
+        )
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_metadata_results(filters: Tuple, size: int) -> List[Dict]:
+    """
+    Busca embeddings apenas por metadados, com cache por 5 minutos.
+
+    Parameters
+    ----------
+    filters : Tuple
+        Filtros de metadados congelados por ``_freeze_filters``
+    size : int
+        Número máximo de resultados
+
+    Returns
+    -------
+    List[Dict]
+        Resultados que atendem aos filtros, sem ids repetidos
+    """
+    filters_dict = {
+        key: dict(value) if isinstance(value, tuple) else value
+        for key, value in filters
+    }
+    return _deduplicate_by_id(
+        _embeddings_service().query_by_metadata(filters_dict, size)
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_advanced_results(sub_queries: Tuple, size: int) -> List[Dict]:
+    """
+    Executa em paralelo a consulta textual e os filtros por campo da
+    busca avançada e junta os resultados, com cache por 5 minutos.
+
+    As threads chamam o serviço de embeddings diretamente; apenas o
+    resultado combinado passa pelo cache, na thread do script.
+
+    Parameters
+    ----------
+    sub_queries : Tuple
+        Pares (texto, filtros congelados por ``_freeze_filters``); texto
+        vazio indica busca apenas por metadados
+    size : int
+        Número máximo de resultados
+
+    Returns
+    -------
+    List[Dict]
+        Resultados combinados na ordem das consultas, sem ids repetidos
+    """
+    service = _embeddings_service()
+
+    def run_sub_query(sub_query):
+        query, filters = sub_query
+        filters_dict = {
+            key: dict(value) if isinstance(value, tuple) else value
+            for key, value in filters
+        }
+        if query:
+            return service.query_embeddings_by_text(
+                query, size, filters_dict or None
+            )
+        return service.query_by_metadata(filters_dict, size)
+
+    with ThreadPoolExecutor(max_workers=len(sub_queries)) as executor:
+        result_lists = list(executor.map(run_sub_query, sub_queries))
+
+    return _deduplicate_by_id([
+        result
+        for result_list in result_lists
+        for result in result_list
+    ])[:size]
+
+
+def _deduplicate_by_id(results: List[Dict]) -> List[Dict]:
+    """
+    Remove resultados repetidos (mesmo ``id``), mantendo a primeira
+    ocorrência.
+
+    Parameters
+    ----------
+    results : List[Dict]
+        Resultados da busca
+
+    Returns
+    -------
+    List[Dict]
+        Resultados sem repetição, na ordem original
+    """
+    seen = set()
+    unique_results = []
+    for result in results:
+        result_id = result.get('id', id(result))
+        if result_id not in seen:
+            seen.add(result_id)
+            unique_results.append(result)
+    return unique_results
+
+
+def _escape_truncated(text, limit: int) -> str:
+    """
+    Trunca o texto e só então escapa o HTML, para que textos longos não
+    sejam escapados por inteiro e nenhuma entidade seja cortada ao meio.
+
+    Parameters
+    ----------
+    text : Any
+        Texto original
+    limit : int
+        Número máximo de caracteres exibidos
+
+    Returns
+    -------
+    str
+        Texto truncado e escapado, com reticências se foi cortado
+    """
+    text = str(text)
+    if len(text) > limit:
+        return html.escape(text[:limit]) + "..."
+    return html.escape(text)
+
+
+def _escape_result(result: Dict) -> Dict[str, str]:
+    """
+    Escapa uma única vez os campos curtos exibidos de um resultado,
+    usando os metadados quando o campo não vem no próprio resultado.
+    Título e conteúdo são truncados antes do escape, em
+    ``_escape_truncated``.
+
+    Parameters
+    ----------
+    result : Dict
+        Dados do resultado
+
+    Returns
+    -------
+    Dict[str, str]
+        Campos escapados para exibição
+    """
+    metadata = result.get('metadata', {})
+    return {
+        'author': html.escape(
+            str(result.get('author', metadata.get('author', '')))
+        ),
+        'platform': html.escape(
+            str(result.get('platform', metadata.get('platform_display', '')))
+        ),
+        'theme': html.escape(
+            str(result.get('theme', metadata.get('theme', '')))
+        ),
+        'origin': html.escape(
+            str(result.get('origin', metadata.get('origin', '')))
+        ),
+        'created_at': html.escape(str(result.get('created_at', ''))),
+        'tags': html.escape(str(metadata.get('tags', '')))
+    }
+
+
+def _results_frame(results: List[Dict]) -> pd.DataFrame:
+    """
+    Monta um DataFrame com os campos usados nas estatísticas, ordenação
+    e agrupamento dos resultados. O índice corresponde à posição do
+    resultado na lista original.
+
+    Parameters
+    ----------
+    results : List[Dict]
+        Resultados da busca
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas type, score, created_at, author e platform
+    """
+    return pd.DataFrame({
+        'type': [result.get('type') for result in results],
+        'score': [result.get('score', 0) for result in results],
+        'created_at': [result.get('created_at', '') for result in results],
+        'author': [result.get('author', '') for result in results],
+        'platform': [result.get('platform', '') for result in results]
+    })
+
 
 class SearchResults:
     """
@@ -12,8 +295,7 @@ class SearchResults:
     """
 
     def __init__(self):
-        from services.embeddings_service import EmbeddingsService
-        self.embeddings_service = EmbeddingsService()
+        self.embeddings_service = _embeddings_service()
 
     def display_search_interface(self):
         """
@@ -22,24 +304,28 @@ class SearchResults:
         st.subheader("🔍 Busca na Base de Embeddings")
 
         # Verificar conexão com a API
-        if not self.embeddings_service.health_check():
+        if not _embeddings_api_available():
             st.toast("API de embeddings não está disponível", icon="❌")
             return
 
-        # Abas para diferentes tipos de busca
-        tab_text, tab_metadata, tab_advanced = st.tabs([
-            "📝 Busca Textual",
-            "🏷️ Busca por Metadados",
-            "⚙️ Busca Avançada"
-        ])
+        # Apenas o painel do tipo de busca selecionado é montado
+        search_mode = st.radio(
+            "Tipo de busca:",
+            [
+                "📝 Busca Textual",
+                "🏷️ Busca por Metadados",
+                "⚙️ Busca Avançada"
+            ],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="search_mode"
+        )
 
-        with tab_text:
+        if search_mode == "📝 Busca Textual":
             self._display_text_search()
-
-        with tab_metadata:
+        elif search_mode == "🏷️ Busca por Metadados":
             self._display_metadata_search()
-
-        with tab_advanced:
+        else:
             self._display_advanced_search()
 
     def _display_text_search(self):
@@ -80,10 +366,16 @@ class SearchResults:
 
         # Executar busca
         if search_button and search_query.strip():
-            self._perform_text_search(search_query.strip(), result_size)
+            self._start_search(
+                'text', {'query': search_query.strip(), 'size': result_size}
+            )
         elif search_button and not search_query.strip():
             st.toast("Por favor, digite uma consulta para buscar.", icon="⚠️")
 
+        params = self._last_search_params('text')
+        if params:
+            self._perform_text_search(**params)
+
     def _display_metadata_search(self):
         """
         Interface de busca por metadados específicos
@@ -109,14 +401,7 @@ class SearchResults:
 
             platform_filter = st.selectbox(
                 "📱 Plataforma:",
-                options=[
-                    "",
-                    "Facebook",
-                    "Instagram",
-                    "LinkedIn",
-                    "TikTok",
-                    "Twitter",
-                    "YouTube"],
+                options=_PLATFORM_OPTIONS,
                 help="Selecionar plataforma específica",
                 key="metadata_platform")
 
@@ -138,18 +423,13 @@ class SearchResults:
 
             origin_filter = st.selectbox(
                 "🗂️ Origem:",
-                options=[
-                    "",
-                    "webscraping",
-                    "generated",
-                    "business_brain",
-                    "manual"],
+                options=_ORIGIN_OPTIONS,
                 help="Filtrar por origem do conteúdo",
                 key="metadata_origin")
 
             content_type_filter = st.selectbox(
                 "📄 Tipo de Conteúdo:",
-                options=["", "post", "article", "video", "image", "text"],
+                options=_CONTENT_TYPE_OPTIONS,
                 help="Filtrar por tipo de conteúdo",
                 key="metadata_content_type"
             )
@@ -190,7 +470,7 @@ class SearchResults:
             type="primary",
                 key="metadata_search_btn"):
             # Preparar critérios de busca
-            search_criteria = {}
+            search_criteria: Dict = {}
 
             if author_filter:
                 search_criteria['author'] = author_filter
@@ -204,17 +484,27 @@ class SearchResults:
                 search_criteria['origin'] = origin_filter
             if content_type_filter:
                 search_criteria['content_type'] = content_type_filter
+
+            word_count_range = {}
             if word_count_min > 0:
-                search_criteria['word_count_min'] = str(word_count_min)
+                word_count_range['gte'] = int(word_count_min)
             if word_count_max < 1000:
-                search_criteria['word_count_max'] = str(word_count_max)
+                word_count_range['lte'] = int(word_count_max)
+            if word_count_range:
+                search_criteria['word_count'] = word_count_range
 
             if search_criteria:
-                self._perform_metadata_search(
-                    search_criteria, result_size_meta)
+                self._start_search('metadata', {
+                    'search_criteria': search_criteria,
+                    'size': result_size_meta
+                })
             else:
                 st.toast("Defina ao menos um critério de busca", icon="⚠️")
 
+        params = self._last_search_params('metadata')
+        if params:
+            self._perform_metadata_search(**params)
+
     def _display_advanced_search(self):
         """
         Interface de busca avançada combinando texto e metadados
@@ -267,41 +557,80 @@ class SearchResults:
             type="primary",
                 key="advanced_search_btn"):
             if search_query.strip() or any([theme, platform, origin, author]):
-                self._perform_advanced_search(
-                    query=search_query or "",
-                    theme=theme or "",
-                    platform=platform or "",
-                    origin=origin or "",
-                    author=author or "",
-                    created_after=(created_after.isoformat()
-                                   if created_after else ""),
-                    created_before=(created_before.isoformat()
-                                    if created_before else ""),
-                    search_fields=search_fields,
-                    size=result_size_adv)
+                self._start_search('advanced', {
+                    'query': search_query or "",
+                    'theme': theme or "",
+                    'platform': platform or "",
+                    'origin': origin or "",
+                    'author': author or "",
+                    'created_after': (created_after.isoformat()
+                                      if created_after else ""),
+                    'created_before': (created_before.isoformat()
+                                       if created_before else ""),
+                    'search_fields': search_fields,
+                    'size': result_size_adv
+                })
             else:
                 st.toast(
                     "Forneça uma consulta textual ou filtros de metadados",
                     icon="⚠️")
 
+        params = self._last_search_params('advanced')
+        if params:
+            self._perform_advanced_search(**params)
+
+    def _start_search(self, kind: str, params: Dict):
+        """
+        Guarda a busca na sessão, para que os resultados continuem
+        exibidos nas reexecuções da página (paginação, ordenação).
+
+        Parameters
+        ----------
+        kind : str
+            Tipo da busca (text, metadata ou advanced)
+        params : Dict
+            Argumentos do método de busca correspondente
+        """
+        st.session_state['last_search'] = (kind, params)
+        st.session_state['results_page'] = 0
+
+    def _last_search_params(self, kind: str) -> Optional[Dict]:
+        """
+        Retorna os argumentos da última busca, se ela for do tipo informado.
+
+        Parameters
+        ----------
+        kind : str
+            Tipo da busca (text, metadata ou advanced)
+
+        Returns
+        -------
+        Optional[Dict]
+            Argumentos do método de busca ou None
+        """
+        last_search = st.session_state.get('last_search')
+        if last_search and last_search[0] == kind:
+            return last_search[1]
+        return None
+
     def _perform_text_search(self, query: str, size: int):
         """
         Executa busca textual simples
         """
         with st.spinner(f"🔍 Buscando por '{query}'..."):
             try:
-                results = self.embeddings_service.query_embeddings_by_text(
-                    query)
-                if len(results) > size:
-                    results = results[:size]
+                results = _fetch_results(query, (), size)
 
                 if not results:
                     st.toast("Nenhum resultado encontrado.", icon="📭")
                     self._display_search_tips()
                     return
 
-                self._display_search_statistics(results, query)
-                self._display_search_results(results, show_metadata=True)
+                frame = _results_frame(results)
+                self._display_search_statistics(frame, query)
+                self._display_search_results(
+                    results, frame, show_metadata=True
+                )
 
             except Exception as e:
                 logger.error(f"Error during text search: {e}")
@@ -313,20 +642,10 @@ class SearchResults:
         """
         with st.spinner("🏷️ Buscando por metadados..."):
             try:
-                # Usar busca por texto para simular busca por metadados
-                search_terms = []
-                for key, value in search_criteria.items():
-                    if value:
-                        search_terms.append(value)
-
-                if search_terms:
-                    query = " ".join(search_terms)
-                    results = self.embeddings_service.query_embeddings_by_text(
-                        query)
-                    if len(results) > size:
-                        results = results[:size]
-                else:
-                    results = []
+                # Busca estruturada: sem consulta textual nem relevância
+                results = _fetch_metadata_results(
+                    _freeze_filters(search_criteria), size
+                )
 
                 if not results:
                     st.toast(
@@ -349,8 +668,11 @@ class SearchResults:
                     f"**Critérios aplicados:** {', '.join(criteria_display)}"
                 )
 
-                self._display_search_statistics(results, "metadados")
-                self._display_search_results(results, show_metadata=True)
+                frame = _results_frame(results)
+                self._display_search_statistics(frame, "metadados")
+                self._display_search_results(
+                    results, frame, show_metadata=True
+                )
 
             except Exception as e:
                 logger.error(f"Error during metadata search: {e}")
@@ -366,27 +688,24 @@ class SearchResults:
         """
         with st.spinner("🚀 Executando busca avançada..."):
             try:
-                # Combinar todos os termos para busca avançada
-                search_terms = []
+                # Consulta textual e filtros por campo executados em paralelo
+                sub_queries = []
                 if query.strip():
-                    search_terms.append(query)
-                if theme:
-                    search_terms.append(theme)
-                if platform:
-                    search_terms.append(platform)
-                if origin:
-                    search_terms.append(origin)
-                if author:
-                    search_terms.append(author)
-
-                if search_terms:
-                    combined_query = " ".join(search_terms)
-                    results = self.embeddings_service.query_embeddings_by_text(
-                        combined_query)
-                    if len(results) > size:
-                        results = results[:size]
-                else:
-                    results = []
+                    sub_queries.append((query.strip(), ()))
+                for field, value in (
+                    ('theme', theme),
+                    ('platform', platform),
+                    ('origin', origin),
+                    ('author', author)
+                ):
+                    if value:
+                        sub_queries.append(
+                            ("", _freeze_filters({field: value}))
+                        )
+
+                results = _fetch_advanced_results(
+                    tuple(sub_queries), size
+                ) if sub_queries else []
 
                 if not results:
                     st.toast(
@@ -416,8 +735,11 @@ class SearchResults:
                 if criteria:
                     st.success(f"**Critérios:** {' • '.join(criteria)}")
 
-                self._display_search_statistics(results, "busca avançada")
-                self._display_search_results(results, show_metadata=True)
+                frame = _results_frame(results)
+                self._display_search_statistics(frame, "busca avançada")
+                self._display_search_results(
+                    results, frame, show_metadata=True
+                )
 
             except Exception as e:
                 logger.error(f"Error during advanced search: {e}")
@@ -436,45 +758,40 @@ class SearchResults:
         - Use a busca textual se não encontrar por metadados
         """)
 
-    def _display_search_statistics(self, results: List[Dict], query: str):
+    def _display_search_statistics(self, frame: pd.DataFrame, query: str):
         """
         Exibe estatísticas da busca
 
         Parameters
         ----------
-        results : List[Dict]
-            Resultados da busca
+        frame : pd.DataFrame
+            Resultados da busca montados por ``_results_frame``
         query : str
             Consulta original
         """
-        # Contar por tipo e índice
-        type_counts: Dict[str, int] = {}
-        index_counts: Dict[str, int] = {}
-
-        for result in results:
-            result_type = result.get('type', 'Desconhecido')
-            result_index = result.get('index', 'unknown')
-
-            type_counts[result_type] = type_counts.get(result_type, 0) + 1
-            index_counts[result_index] = index_counts.get(result_index, 0) + 1
+        # Contar por tipo, na ordem em que os tipos aparecem
+        type_counts = frame.groupby(
+            frame['type'].fillna('Desconhecido'), sort=False
+        ).size().to_dict()
 
         # Análise de relevância
-        scores = [r.get('score', 0) for r in results if r.get('score', 0) > 0]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        max_score = max(scores) if scores else 0
+        scores = frame['score'][frame['score'] > 0]
+        avg_score = scores.mean() if not scores.empty else 0
+        max_score = scores.max() if not scores.empty else 0
 
         # Escapar HTML da consulta para evitar problemas de renderização
         escaped_query = html.escape(str(query))
 
         # Exibir estatísticas
+        summary = (
+            f"**Total:** {len(frame)} | "
+            f"**Relevância máxima:** {max_score:.1f} | "
+            f"**Relevância média:** {avg_score:.1f}"
+        )
         st.success(f"""
         **Resultados para:** "{escaped_query}"
 
-        **Total:** {
-            len(results)
-        } | **Relevância máxima:** {
-            max_score:.1f
-        } | **Relevância média:** {avg_score:.1f}
+        {summary}
         """)
 
         # Distribuição por tipo
@@ -490,6 +807,7 @@ class SearchResults:
     def _display_search_results(
         self,
         results: List[Dict],
+        frame: pd.DataFrame,
         show_metadata: bool
     ):
         """
@@ -499,11 +817,15 @@ class SearchResults:
         ----------
         results : List[Dict]
             Resultados da busca
+        frame : pd.DataFrame
+            Resultados da busca montados por ``_results_frame``
         show_metadata : bool
             Se deve exibir metadados detalhados
         """
         st.markdown("### 📋 Resultados Detalhados")
 
+        sort_by = "Relevância"
+        view_mode = "Compacto"
         if show_metadata:
             # Opção de visualização
             col_view, col_sort = st.columns([2, 2])
@@ -522,69 +844,103 @@ class SearchResults:
                     key="results_sort"
                 )
 
-            # Aplicar ordenação
-            if sort_by == "Data":
-                results.sort(
-                    key=lambda x: x.get('created_at', ''), reverse=True
-                )
-            elif sort_by == "Autor":
-                results.sort(key=lambda x: x.get('author', ''))
-            elif sort_by == "Plataforma":
-                results.sort(key=lambda x: x.get('platform', ''))
-            # Relevância já vem ordenada por padrão
-
-        # Agrupar por tipo para melhor organização
-        results_by_type: Dict[str, List[Dict]] = {}
-        for result in results:
-            result_type = result.get('type', 'Post Gerado')
-            if result_type not in results_by_type:
-                results_by_type[result_type] = []
-            results_by_type[result_type].append(result)
-
-        # Ordenar cada grupo por score se não foi aplicada outra ordenação
-        if not show_metadata or sort_by == "Relevância":
-            for tipo in results_by_type:
-                results_by_type[tipo].sort(
-                    key=lambda x: x.get('score', 0),
-                    reverse=True
-                )
+        # Aplicar ordenação (estável, como a ordenação de listas)
+        if sort_by == "Data":
+            frame = frame.sort_values(
+                'created_at', ascending=False, kind='stable'
+            )
+        elif sort_by == "Autor":
+            frame = frame.sort_values('author', kind='stable')
+        elif sort_by == "Plataforma":
+            frame = frame.sort_values('platform', kind='stable')
+        else:
+            frame = frame.sort_values(
+                'score', ascending=False, kind='stable'
+            )
+
+        # Paginação: apenas os cards da página atual são montados
+        total_pages = (len(frame) - 1) // _RESULTS_PER_PAGE + 1 if len(
+            frame
+        ) > 0 else 1
+        page = min(st.session_state.get('results_page', 0), total_pages - 1)
+
+        if total_pages > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                if st.button(
+                    "⬅️ Anterior",
+                    disabled=page == 0,
+                    use_container_width=True,
+                    key="results_prev"
+                ):
+                    st.session_state['results_page'] = page - 1
+                    st.rerun()
+            with col_page:
+                st.caption(f"📄 Página {page + 1} de {total_pages}")
+            with col_next:
+                if st.button(
+                    "Próxima ➡️",
+                    disabled=page >= total_pages - 1,
+                    use_container_width=True,
+                    key="results_next"
+                ):
+                    st.session_state['results_page'] = page + 1
+                    st.rerun()
+
+        frame = frame.iloc[
+            page * _RESULTS_PER_PAGE:(page + 1) * _RESULTS_PER_PAGE
+        ]
+
+        # Agrupar por tipo para melhor organização (posições em results)
+        results_by_type: Dict[str, List[int]] = {
+            result_type: list(group.index)
+            for result_type, group in frame.groupby(
+                frame['type'].fillna('Post Gerado'), sort=False
+            )
+        }
+
+        # Renderizador escolhido uma única vez para todos os resultados
+        if show_metadata:
+            render_result = {
+                "Compacto": self._render_compact,
+                "Detalhado": self._render_detailed,
+                "Metadados Completos": self._render_full
+            }[view_mode]
+        else:
+            render_result = self._display_single_result
 
         # Exibir resultados por tipo
-        for result_type, type_results in results_by_type.items():
+        for result_type, positions in results_by_type.items():
 
             # Cabeçalho do tipo com ícones apropriados
-            type_icons = {
-                'Post Gerado': '📝',
-                'Consultoria Comercial': '💼',
-                'Reunião de Consultores': '🤝',
-                'Base de Conhecimento': '📚',
-                'Embedding': '🧠'
-            }
-            icon = type_icons.get(result_type, '📄')
+            icon = _TYPE_ICONS.get(result_type, '📄')
 
             # Escapar HTML do tipo de resultado
             escaped_result_type = html.escape(str(result_type))
 
             st.info(f"""
-            **{icon} {escaped_result_type}** ({len(type_results)} resultados)
+            **{icon} {escaped_result_type}** ({len(positions)} resultados)
             """)
 
             # Resultados do tipo
-            for i, result in enumerate(type_results, 1):
-                if show_metadata:
-                    self._display_enhanced_result(
-                        result, i, result_type, view_mode if (
-                            show_metadata
-                        ) else "Compacto"
-                    )
-                else:
-                    self._display_single_result(result, i, result_type)
+            for i, position in enumerate(positions, 1):
+                result = results[position]
+                # Chave estável: o widget mantém o estado entre reexecuções
+                render_result(
+                    result,
+                    _escape_result(result),
+                    i,
+                    result_type,
+                    f"result_{result.get('id', position)}"
+                )
 
     def _display_single_result(
         self,
         result: Dict,
+        escaped: Dict[str, str],
         index: int,
-        result_type: str
+        result_type: str,
+        widget_key: str
     ):
         """
         Exibe um resultado individual
@@ -593,19 +949,21 @@ class SearchResults:
         ----------
         result : Dict
             Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
         index : int
             Índice do resultado
         result_type : str
             Tipo do resultado
+        widget_key : str
+            Chave estável dos widgets do resultado
         """
         # Cores por tipo de resultado definidas (para uso futuro)
 
-        # Extrair e escapar dados para HTML
-        title = html.escape(str(result.get('title', 'Sem título')))
-        content = html.escape(str(result.get('content', '')))
+        # Dados já escapados para HTML
         score = result.get('score', 0)
-        author = html.escape(str(result.get('author', '')))
-        created_at = html.escape(str(result.get('created_at', '')))
+        author = escaped['author']
+        created_at = escaped['created_at']
 
         # Dados específicos por tipo (também escapados)
         extra_info = []
@@ -616,22 +974,20 @@ class SearchResults:
             produto_escaped = html.escape(str(result.get('produto_ofertado')))
             extra_info.append(f"Produto: {produto_escaped}")
         if result.get('resumo'):
-            resumo_escaped = html.escape(str(result.get('resumo', ''))[:100])
-            extra_info.append(f"Resumo: {resumo_escaped}...")
+            resumo_escaped = _escape_truncated(result.get('resumo'), 100)
+            extra_info.append(f"Resumo: {resumo_escaped}")
         if result.get('tags'):
             tags = result.get('tags', [])
             if isinstance(tags, list):
                 tags_escaped = [html.escape(str(tag)) for tag in tags[:3]]
                 extra_info.append(f"Tags: {', '.join(tags_escaped)}")
 
-        # Truncar conteúdo para prévia (após escape HTML)
-        content_preview = content[:400] + "..." if len(content) > 400 else (
-            content
+        # Truncar conteúdo e título antes do escape HTML
+        content_preview = _escape_truncated(result.get('content', ''), 400)
+        title_display = _escape_truncated(
+            result.get('title', 'Sem título'), 100
         )
 
-        # Truncar título também
-        title_display = title[:100] + "..." if len(title) > 100 else title
-
         # Preparar informações extras escapadas
         extra_info_escaped = " • ".join(extra_info)
 
@@ -665,203 +1021,304 @@ class SearchResults:
                 height=150,
                 disabled=True,
                 label_visibility="collapsed",
-                key=f"content_{index}_{result_type}"
+                key=widget_key
             )
 
             st.divider()
 
-    def _display_enhanced_result(
+    def _render_compact(
         self,
         result: Dict,
+        escaped: Dict[str, str],
         index: int,
         result_type: str,
-        view_mode: str = "Detalhado"
+        widget_key: str
     ):
         """
-        Exibe um resultado individual com metadados aprimorados
+        Exibe um resultado no modo de visualização Compacto
 
         Parameters
         ----------
         result : Dict
             Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
         index : int
             Índice do resultado
         result_type : str
             Tipo do resultado
-        view_mode : str
-            Modo de visualização (Compacto, Detalhado, Metadados Completos)
+        widget_key : str
+            Chave estável dos widgets do resultado
         """
-        # Extrair dados principais
-        title = html.escape(str(result.get('title', 'Sem título')))
-        content = html.escape(
-            str(result.get('content', result.get('text', '')))
-        )
-        score = result.get('score', 0)
+        with st.container():
+            self._display_result_summary(
+                result, escaped, index, widget_key,
+                title_limit=80, content_limit=200, height=100
+            )
+            st.divider()
 
-        # Extrair metadados
-        metadata = result.get('metadata', {})
+    def _render_detailed(
+        self,
+        result: Dict,
+        escaped: Dict[str, str],
+        index: int,
+        result_type: str,
+        widget_key: str
+    ):
+        """
+        Exibe um resultado no modo de visualização Detalhado
 
-        # Informações básicas
-        author = html.escape(
-            str(result.get('author', metadata.get('author', '')))
-        )
-        platform = html.escape(
-            str(result.get('platform', metadata.get('platform_display', '')))
-        )
-        theme = html.escape(
-            str(result.get('theme', metadata.get('theme', '')))
+        Parameters
+        ----------
+        result : Dict
+            Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
+        index : int
+            Índice do resultado
+        result_type : str
+            Tipo do resultado
+        widget_key : str
+            Chave estável dos widgets do resultado
+        """
+        with st.container():
+            self._display_result_summary(
+                result, escaped, index, widget_key,
+                title_limit=120, content_limit=500, height=150
+            )
+            self._display_result_details(result, escaped)
+            st.divider()
+
+    def _render_full(
+        self,
+        result: Dict,
+        escaped: Dict[str, str],
+        index: int,
+        result_type: str,
+        widget_key: str
+    ):
+        """
+        Exibe um resultado no modo de visualização Metadados Completos
+
+        Parameters
+        ----------
+        result : Dict
+            Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
+        index : int
+            Índice do resultado
+        result_type : str
+            Tipo do resultado
+        widget_key : str
+            Chave estável dos widgets do resultado
+        """
+        with st.container():
+            self._display_result_summary(
+                result, escaped, index, widget_key,
+                title_limit=120, content_limit=500, height=150
+            )
+            self._display_result_details(result, escaped)
+            self._display_complete_metadata(result, index, result_type)
+            st.divider()
+
+    def _display_result_summary(
+        self,
+        result: Dict,
+        escaped: Dict[str, str],
+        index: int,
+        widget_key: str,
+        title_limit: int,
+        content_limit: int,
+        height: int
+    ):
+        """
+        Exibe título, score, metadados principais, data e conteúdo de um
+        resultado, comuns a todos os modos de visualização
+
+        Parameters
+        ----------
+        result : Dict
+            Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
+        index : int
+            Índice do resultado
+        widget_key : str
+            Chave estável dos widgets do resultado
+        title_limit : int
+            Número máximo de caracteres do título
+        content_limit : int
+            Número máximo de caracteres da prévia do conteúdo
+        height : int
+            Altura da área de conteúdo
+        """
+        score = result.get('score', 0)
+        created_at = escaped['created_at']
+
+        # Truncar título e conteúdo antes do escape
+        title_display = _escape_truncated(
+            result.get('title', 'Sem título'), title_limit
         )
-        origin = html.escape(
-            str(result.get('origin', metadata.get('origin', '')))
+        content_preview = _escape_truncated(
+            result.get('content', result.get('text', '')), content_limit
         )
-        created_at = html.escape(str(result.get('created_at', '')))
 
-        # Metadados específicos
-        tags = html.escape(str(metadata.get('tags', '')))
-        word_count = metadata.get('word_count', '')
-        content_length = metadata.get('length', '')
-        content_type = metadata.get('content_type', '')
+        # Header com título e score
+        col_title, col_score = st.columns([4, 1])
 
-        # Truncar conteúdo baseado no modo de visualização
-        if view_mode == "Compacto":
-            content_preview = content[:200] + "..." if len(
-                content
-            ) > 200 else content
-            title_display = title[:80] + "..." if len(title) > 80 else title
-        else:
-            content_preview = content[:500] + "..." if len(
-                content
-            ) > 500 else content
-            title_display = title[:120] + "..." if len(title) > 120 else title
+        with col_title:
+            st.markdown(f"**{index}. {title_display}**")
 
-        # Container principal do resultado
-        with st.container():
-            # Header com título e score
-            col_title, col_score = st.columns([4, 1])
+        with col_score:
+            if score >= 0.8:
+                st.success(f"🎯 {score:.3f}")
+            elif score >= 0.6:
+                st.warning(f"🎯 {score:.3f}")
+            else:
+                st.info(f"🎯 {score:.3f}")
+
+        # Metadados principais em linha
+        metadata_line = []
+        if escaped['platform']:
+            metadata_line.append(f"📱 {escaped['platform']}")
+        if escaped['author']:
+            metadata_line.append(f"👤 {escaped['author']}")
+        if escaped['theme']:
+            metadata_line.append(f"🎯 {escaped['theme']}")
+        if escaped['origin']:
+            metadata_line.append(f"🗂️ {escaped['origin']}")
+
+        if metadata_line:
+            st.caption(" • ".join(metadata_line))
+
+        # Data de criação formatada (AAAA-MM-DD -> DD/MM/AAAA)
+        if len(created_at) >= 10:
+            if created_at[4] == '-' and created_at[7] == '-':
+                br_date = (
+                    f"{created_at[8:10]}/{created_at[5:7]}/"
+                    f"{created_at[:4]}"
+                )
+                st.caption(f"📅 {br_date}")
+            else:
+                st.caption(f"📅 {created_at[:10]}")
+
+        # Conteúdo
+        st.text_area(
+            "Conteúdo:",
+            value=content_preview,
+            height=height,
+            disabled=True,
+            label_visibility="collapsed",
+            key=widget_key
+        )
 
-            with col_title:
-                st.markdown(f"**{index}. {title_display}**")
+    def _display_result_details(self, result: Dict, escaped: Dict[str, str]):
+        """
+        Exibe tags, contagem de palavras e tamanho de um resultado
 
-            with col_score:
-                if score >= 0.8:
-                    st.success(f"🎯 {score:.3f}")
-                elif score >= 0.6:
-                    st.warning(f"🎯 {score:.3f}")
-                else:
-                    st.info(f"🎯 {score:.3f}")
-
-            # Metadados principais em linha
-            metadata_line = []
-            if platform:
-                metadata_line.append(f"📱 {platform}")
-            if author:
-                metadata_line.append(f"👤 {author}")
-            if theme:
-                metadata_line.append(f"🎯 {theme}")
-            if origin:
-                metadata_line.append(f"🗂️ {origin}")
-
-            if metadata_line:
-                st.caption(" • ".join(metadata_line))
-
-            # Data de criação formatada
-            if created_at and len(created_at) >= 10:
-                try:
-                    from datetime import datetime
-                    date_obj = datetime.strptime(created_at[:10], '%Y-%m-%d')
-                    br_date = date_obj.strftime('%d/%m/%Y')
-                    st.caption(f"📅 {br_date}")
-                except Exception:
-                    st.caption(f"📅 {created_at[:10]}")
-
-            # Conteúdo
-            st.text_area(
-                "Conteúdo:",
-                value=content_preview,
-                height=150 if view_mode != "Compacto" else 100,
-                disabled=True,
-                label_visibility="collapsed",
-                key=f"""enhanced_content_{index}_{result_type}_{hash(str(
-                    result.get('id', index)))}"""
-            )
+        Parameters
+        ----------
+        result : Dict
+            Dados do resultado
+        escaped : Dict[str, str]
+            Campos do resultado já escapados por ``_escape_result``
+        """
+        metadata = result.get('metadata', {})
+        tags = escaped['tags']
+        word_count = metadata.get('word_count', '')
+        content_length = metadata.get('length', '')
 
-            # Metadados adicionais baseados no modo de visualização
-            if view_mode == "Detalhado" or view_mode == "Metadados Completos":
+        if tags or word_count or content_length:
+            col_meta1, col_meta2, col_meta3 = st.columns(3)
 
-                if tags or word_count or content_length:
-                    col_meta1, col_meta2, col_meta3 = st.columns(3)
+            with col_meta1:
+                if tags:
+                    st.caption(f"🏷️ **Tags:** {tags}")
 
-                    with col_meta1:
-                        if tags:
-                            st.caption(f"🏷️ **Tags:** {tags}")
+            with col_meta2:
+                if word_count:
+                    st.caption(f"📊 **Palavras:** {word_count}")
 
-                    with col_meta2:
-                        if word_count:
-                            st.caption(f"📊 **Palavras:** {word_count}")
+            with col_meta3:
+                if content_length:
+                    st.caption(f"📏 **Tamanho:** {content_length}")
 
-                    with col_meta3:
-                        if content_length:
-                            st.caption(f"📏 **Tamanho:** {content_length}")
+    def _display_complete_metadata(
+        self,
+        result: Dict,
+        index: int,
+        result_type: str
+    ):
+        """
+        Exibe todos os metadados de um resultado em um expander
 
-            # Modo "Metadados Completos" - mostra tudo em expandir
-            if view_mode == "Metadados Completos":
-                with st.expander(
-                    f"🔍 Metadados Completos - Resultado {index}",
-                    expanded=False
-                ):
-                    col_complete1, col_complete2 = st.columns(2)
-
-                    with col_complete1:
-                        st.markdown("**📋 Dados Básicos:**")
-                        st.markdown(f"- **ID:** {result.get('id', 'N/A')}")
-                        st.markdown(f"- **Tipo:** {result_type}")
-                        st.markdown(
-                            f"- **Índice:** {result.get('index', 'N/A')}"
-                        )
-                        st.markdown(f"- **Score:** {score:.4f}")
-                        if content_type:
-                            st.markdown(f"- **Tipo Conteúdo:** {content_type}")
-
-                    with col_complete2:
-                        st.markdown("**🔧 Metadados Técnicos:**")
-                        st.markdown(f"""- **Dimensão Vetor:** {
-                            result.get('vector_dimension', 'N/A')
-                        }""")
-                        st.markdown(
-                            f"""- **Atualizado:** {
-                                result.get(
-                                    'updated_at',
-                                    'N/A'
-                                )[:10] if result.get(
-                                    'updated_at'
-                                ) else 'N/A'}"""
-                        )
-                        st.markdown(
-                            f"""- **Código Plataforma:** {
-                                metadata.get(
-                                    'platform_code',
-                                    metadata.get(
-                                        'platform',
-                                        'N/A'))}""")
-
-                        # Exibir metadados originais se disponíveis
-                        original_metadata = metadata.get(
-                            'original_metadata', {})
-                        if original_metadata and len(original_metadata) > 0:
-                            st.markdown("**🗂️ Metadados Originais:**")
-                            for key, value in original_metadata.items():
-                                if value and str(value).strip():
-                                    st.markdown(
-                                        f"""- **{
-                                            key
-                                        }:** {
-                                            str(value)[:50]
-                                        }{'...' if len(
-                                            str(value)
-                                        ) > 50 else ''}"""
-                                    )
+        Parameters
+        ----------
+        result : Dict
+            Dados do resultado
+        index : int
+            Índice do resultado
+        result_type : str
+            Tipo do resultado
+        """
+        metadata = result.get('metadata', {})
+        content_type = metadata.get('content_type', '')
 
-            st.divider()
+        with st.expander(
+            f"🔍 Metadados Completos - Resultado {index}",
+            expanded=False
+        ):
+            col_complete1, col_complete2 = st.columns(2)
+
+            with col_complete1:
+                st.markdown("**📋 Dados Básicos:**")
+                st.markdown(f"- **ID:** {result.get('id', 'N/A')}")
+                st.markdown(f"- **Tipo:** {result_type}")
+                st.markdown(
+                    f"- **Índice:** {result.get('index', 'N/A')}"
+                )
+                st.markdown(f"- **Score:** {result.get('score', 0):.4f}")
+                if content_type:
+                    st.markdown(f"- **Tipo Conteúdo:** {content_type}")
+
+            with col_complete2:
+                st.markdown("**🔧 Metadados Técnicos:**")
+                st.markdown(f"""- **Dimensão Vetor:** {
+                    result.get('vector_dimension', 'N/A')
+                }""")
+                st.markdown(
+                    f"""- **Atualizado:** {
+                        result.get(
+                            'updated_at',
+                            'N/A'
+                        )[:10] if result.get(
+                            'updated_at'
+                        ) else 'N/A'}"""
+                )
+                st.markdown(
+                    f"""- **Código Plataforma:** {
+                        metadata.get(
+                            'platform_code',
+                            metadata.get(
+                                'platform',
+                                'N/A'))}""")
+
+                # Exibir metadados originais se disponíveis
+                original_metadata = metadata.get(
+                    'original_metadata', {})
+                if original_metadata and len(original_metadata) > 0:
+                    st.markdown("**🗂️ Metadados Originais:**")
+                    for key, value in original_metadata.items():
+                        if not value:
+                            continue
+                        text_value = str(value)
+                        if not text_value.strip():
+                            continue
+                        preview = text_value[:50] + (
+                            '...' if len(text_value) > 50 else ''
+                        )
+                        st.markdown(f"- **{key}:** {preview}")
 
     def main_interface(self):
         """